@@ -4,12 +4,23 @@ Helius FastMCP server for Solana.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import atexit
+import threading
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 from fastmcp import FastMCP
 
 from src.helius.services import HeliusService
+from src.helius.schemas import (
+    AccountInfoSummary,
+    EnhancedTxSummary,
+    ProgramAccountSummary,
+    SignatureInfo,
+    SignatureStatus,
+    TokenLargestAccountItem,
+    TxRawSummary,
+)
 
 
 mcp = FastMCP(
@@ -18,15 +29,47 @@ mcp = FastMCP(
 )
 
 
-_service = HeliusService()
+_service: Optional[HeliusService] = None
+_service_lock = threading.Lock()
+
+
+def _get_service() -> HeliusService:
+    # Built on first tool call so importing the module does not require HELIUS_API_KEY or open a session;
+    # every tool then shares the same client (and pooled HTTP connections) for the life of the process.
+    # FastMCP runs sync tools on worker threads, so concurrent first calls must not build two services.
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                service = HeliusService()
+                atexit.register(service.client.http.close)
+                _service = service
+    return _service
+
+
+# Each tool knows the shape its service method returns, so it picks the matching dumper
+# instead of a generic recursive walk. Non-model values (raw fallbacks, None) pass through.
+def _dump_one(obj: Any) -> Any:
+    return obj.model_dump() if isinstance(obj, BaseModel) else obj
+
+
+def _dump_list(objs: Any, adapter: Optional[TypeAdapter[Any]] = None) -> Any:
+    if not isinstance(objs, list):
+        return _dump_one(objs)
+    if adapter is not None and objs and isinstance(objs[0], BaseModel):
+        # One pass through pydantic-core for the whole list instead of a model_dump() per item
+        return adapter.dump_python(objs)
+    return [x.model_dump() if isinstance(x, BaseModel) else x for x in objs]
 
 
-def _as_dict(obj: Any) -> Any:
-    if isinstance(obj, BaseModel):
-        return obj.model_dump()
-    if isinstance(obj, list):
-        return [_as_dict(x) for x in obj]
-    return obj
+# Built once at import; reused by the list-returning tools below
+_ENHANCED_TX_LIST = TypeAdapter(List[EnhancedTxSummary])
+_SIGNATURE_INFO_LIST = TypeAdapter(List[SignatureInfo])
+_SIGNATURE_STATUS_LIST = TypeAdapter(List[Optional[SignatureStatus]])
+_ACCOUNT_INFO_LIST = TypeAdapter(List[Optional[AccountInfoSummary]])
+_PROGRAM_ACCOUNT_LIST = TypeAdapter(List[ProgramAccountSummary])
+_TOKEN_LARGEST_LIST = TypeAdapter(List[TokenLargestAccountItem])
+_TX_RAW_LIST = TypeAdapter(List[Optional[TxRawSummary]])
 
 
 # --- Enhanced (REST) -------------------------------------------------------
@@ -34,7 +77,7 @@ def _as_dict(obj: Any) -> Any:
 
 def get_transactions(signatures: List[str], network: str = "mainnet") -> List[Dict[str, Any]]:
     """Decode tx signatures via Enhanced API (human-readable)."""
-    return _as_dict(_service.get_transactions(signatures, network))
+    return _dump_list(_get_service().get_transactions(signatures, network), _ENHANCED_TX_LIST)
 
 
 def get_transactions_by_address(
@@ -48,8 +91,9 @@ def get_transactions_by_address(
     commitment: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """Enhanced history for an address with filters."""
-    return _as_dict(
-        _service.get_transactions_by_address(address, network, tx_type, source, before, until, limit, commitment)
+    return _dump_list(
+        _get_service().get_transactions_by_address(address, network, tx_type, source, before, until, limit, commitment),
+        _ENHANCED_TX_LIST,
     )
 
 
@@ -59,13 +103,16 @@ def get_transactions_by_address(
 def get_signatures_for_address(
     address: str,
     network: str = "mainnet",
-    limit: int = 1000,
+    limit: Annotated[int, Field(ge=1, le=1000)] = 1000,
     before: Optional[str] = None,
     until: Optional[str] = None,
     commitment: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """Confirmed signatures for an address."""
-    return _as_dict(_service.get_signatures_for_address(address, network, limit, before, until, commitment))
+    return _dump_list(
+        _get_service().get_signatures_for_address(address, network, limit, before, until, commitment),
+        _SIGNATURE_INFO_LIST,
+    )
 
 
 def get_transaction_raw(
@@ -75,7 +122,20 @@ def get_transaction_raw(
     commitment: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Raw getTransaction when Enhanced lacks coverage."""
-    return _as_dict(_service.get_transaction_raw(signature, network, encoding, commitment))
+    return _dump_one(_get_service().get_transaction_raw(signature, network, encoding, commitment))
+
+
+def get_transactions_raw_batch(
+    signatures: List[str],
+    network: str = "mainnet",
+    encoding: str = "jsonParsed",
+    commitment: Optional[str] = None,
+) -> List[Optional[Dict[str, Any]]]:
+    """Raw getTransaction for many signatures in batched requests; unknown signatures come back null."""
+    return _dump_list(
+        _get_service().get_transactions_raw_batch(signatures, network, encoding, commitment),
+        _TX_RAW_LIST,
+    )
 
 
 def simulate_transaction(
@@ -85,7 +145,7 @@ def simulate_transaction(
     commitment: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Simulate a serialized tx (logs, CU, balances)."""
-    return _as_dict(_service.simulate_transaction(transaction, network, sig_verify, commitment))
+    return _dump_one(_get_service().simulate_transaction(transaction, network, sig_verify, commitment))
 
 
 def get_priority_fee_estimate(
@@ -95,7 +155,7 @@ def get_priority_fee_estimate(
     priority_level: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Priority fee estimate. Provide transaction or account_keys."""
-    return _as_dict(_service.get_priority_fee_estimate(network, transaction, account_keys, priority_level))
+    return _dump_one(_get_service().get_priority_fee_estimate(network, transaction, account_keys, priority_level))
 
 def get_signature_statuses(
     signatures: List[str],
@@ -104,8 +164,9 @@ def get_signature_statuses(
     commitment: Optional[str] = None,
 ) -> List[Optional[Dict[str, Any]]]:
     """Statuses for multiple signatures (processed/confirmed/finalized)."""
-    return _as_dict(
-        _service.get_signature_statuses(signatures, network, search_transaction_history, commitment)
+    return _dump_list(
+        _get_service().get_signature_statuses(signatures, network, search_transaction_history, commitment),
+        _SIGNATURE_STATUS_LIST,
     )
 
 
@@ -117,10 +178,11 @@ def get_multiple_accounts(
     data_slice: Optional[Dict[str, int]] = None,
     min_context_slot: Optional[int] = None,
     changed_since_slot: Optional[int] = None,
+    metadata_only: bool = False,
 ) -> List[Optional[Dict[str, Any]]]:
-    """Batch account info for many pubkeys."""
-    return _as_dict(
-        _service.get_multiple_accounts(
+    """Batch account info for many pubkeys. metadata_only skips account data (lamports/owner only)."""
+    return _dump_list(
+        _get_service().get_multiple_accounts(
             pubkeys,
             network,
             encoding,
@@ -128,7 +190,9 @@ def get_multiple_accounts(
             data_slice,
             min_context_slot,
             changed_since_slot,
-        )
+            metadata_only,
+        ),
+        _ACCOUNT_INFO_LIST,
     )
 
 
@@ -140,10 +204,11 @@ def get_program_accounts(
     data_slice: Optional[Dict[str, int]] = None,
     commitment: Optional[str] = None,
     changed_since_slot: Optional[int] = None,
+    metadata_only: bool = False,
 ) -> List[Dict[str, Any]]:
-    """Accounts owned by a program with optional filters."""
-    return _as_dict(
-        _service.get_program_accounts(
+    """Accounts owned by a program with optional filters. metadata_only skips account data."""
+    return _dump_list(
+        _get_service().get_program_accounts(
             program_id,
             network,
             encoding,
@@ -151,7 +216,9 @@ def get_program_accounts(
             data_slice,
             commitment,
             changed_since_slot,
-        )
+            metadata_only,
+        ),
+        _PROGRAM_ACCOUNT_LIST,
     )
 
 
@@ -161,7 +228,7 @@ def get_token_largest_accounts(
     commitment: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """Top 20 largest accounts for a token mint."""
-    return _as_dict(_service.get_token_largest_accounts(mint, network, commitment))
+    return _dump_list(_get_service().get_token_largest_accounts(mint, network, commitment), _TOKEN_LARGEST_LIST)
 
 
 # --- DAS (assets & portfolios) ---------------------------------------------
@@ -169,7 +236,7 @@ def get_token_largest_accounts(
 
 def get_asset(asset_id: str, network: str = "mainnet") -> Dict[str, Any]:
     """Full metadata for one asset (NFT/cNFT/token)."""
-    return _as_dict(_service.get_asset(asset_id, network))
+    return _dump_one(_get_service().get_asset(asset_id, network))
 
 
 def get_assets_by_owner(
@@ -182,8 +249,8 @@ def get_assets_by_owner(
     show_zero_balance: bool = False,
 ) -> Dict[str, Any]:
     """Portfolio: NFTs, compressed, fungibles, optional SOL."""
-    return _as_dict(
-        _service.get_assets_by_owner(owner_address, page, limit, network, show_fungible, show_native_balance, show_zero_balance)
+    return _dump_one(
+        _get_service().get_assets_by_owner(owner_address, page, limit, network, show_fungible, show_native_balance, show_zero_balance)
     )
 
 
@@ -198,8 +265,8 @@ def search_assets(
     page: int = 1,
 ) -> Dict[str, Any]:
     """Search assets by owner/creator/collection/attributes."""
-    return _as_dict(
-        _service.search_assets(network, owner_address, token_type, creator_address, collection, attributes, limit, page)
+    return _dump_one(
+        _get_service().search_assets(network, owner_address, token_type, creator_address, collection, attributes, limit, page)
     )
 
 
@@ -209,7 +276,7 @@ def get_token_accounts(
     network: str = "mainnet",
 ) -> Dict[str, Any]:
     """Token accounts and balances for an owner."""
-    return _as_dict(_service.get_token_accounts(owner, mint, network))
+    return _dump_one(_get_service().get_token_accounts(owner, mint, network))
 
 
 # --- Small helpers ----------------------------------------------------------
@@ -221,7 +288,16 @@ def get_balance(
     commitment: Optional[str] = None,
 ) -> int:
     """Lamport balance for an address."""
-    return _service.get_balance(public_key, network, commitment)
+    return _get_service().get_balance(public_key, network, commitment)
+
+
+def get_balances_batch(
+    public_keys: List[str],
+    network: str = "mainnet",
+    commitment: Optional[str] = None,
+) -> List[int]:
+    """Lamport balances for many addresses, in input order."""
+    return _get_service().get_balances_batch(public_keys, network, commitment)
 
 
 def get_account_info(
@@ -230,11 +306,50 @@ def get_account_info(
     encoding: str = "base64",
 ) -> Dict[str, Any]:
     """Account data and owner."""
-    return _as_dict(_service.get_account_info(address, network, encoding))
+    return _dump_one(_get_service().get_account_info(address, network, encoding))
+
+
+def get_account_infos_batch(
+    addresses: List[str],
+    network: str = "mainnet",
+    encoding: str = "base64",
+) -> List[Optional[Dict[str, Any]]]:
+    """Account info for any number of addresses (chunks of 100, batched); missing accounts are null."""
+    return _dump_list(_get_service().get_account_infos_batch(addresses, network, encoding), _ACCOUNT_INFO_LIST)
+
+
+_TOOLS: Tuple[Callable[..., Any], ...] = (
+    get_transactions,
+    get_transactions_by_address,
+    get_signatures_for_address,
+    get_transaction_raw,
+    get_transactions_raw_batch,
+    simulate_transaction,
+    get_priority_fee_estimate,
+    get_signature_statuses,
+    get_multiple_accounts,
+    get_program_accounts,
+    get_token_largest_accounts,
+    get_asset,
+    get_assets_by_owner,
+    search_assets,
+    get_token_accounts,
+    get_balance,
+    get_balances_batch,
+    get_account_info,
+    get_account_infos_batch,
+)
+
+_PROMPTS_REGISTERED = False
+_TOOLS_REGISTERED = False
 
 
 def register_mcp_prompts_and_resources() -> None:
     """Optional registration hooks for MCP prompts/resources."""
+    global _PROMPTS_REGISTERED
+    if _PROMPTS_REGISTERED:
+        return
+    _PROMPTS_REGISTERED = True
     try:
         # Example prompt placeholder (customize as needed)
         if hasattr(mcp, "add_prompt"):
@@ -262,22 +377,12 @@ def register_mcp_prompts_and_resources() -> None:
 
 def register_mcp_tools() -> None:
     # Register tools programmatically to keep functions callable for tests
-    mcp.tool()(get_transactions)
-    mcp.tool()(get_transactions_by_address)
-    mcp.tool()(get_signatures_for_address)
-    mcp.tool()(get_transaction_raw)
-    mcp.tool()(simulate_transaction)
-    mcp.tool()(get_priority_fee_estimate)
-    mcp.tool()(get_signature_statuses)
-    mcp.tool()(get_multiple_accounts)
-    mcp.tool()(get_program_accounts)
-    mcp.tool()(get_token_largest_accounts)
-    mcp.tool()(get_asset)
-    mcp.tool()(get_assets_by_owner)
-    mcp.tool()(search_assets)
-    mcp.tool()(get_token_accounts)
-    mcp.tool()(get_balance)
-    mcp.tool()(get_account_info)
+    global _TOOLS_REGISTERED
+    if _TOOLS_REGISTERED:
+        return
+    _TOOLS_REGISTERED = True
+    for fn in _TOOLS:
+        mcp.tool()(fn)
 
 
 if __name__ == "__main__":
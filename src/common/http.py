@@ -1,14 +1,61 @@
 from __future__ import annotations
 
+import random
 import time
+from email.utils import parsedate_to_datetime
 from typing import Any, Dict, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
+
+# 5xx gets more attempts than 429: a throttled client should back off sooner than one hitting a blip
+MAX_ATTEMPTS = 5
+MAX_429_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 0.2
+BACKOFF_CAP_SECONDS = 30.0
+# Longest server-requested Retry-After we are willing to sleep through; beyond this we give up instead
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(resp: requests.Response, attempt: int) -> Optional[float]:
+    """Seconds to wait before the next attempt, or None if the server asks for longer than we will wait."""
+    backoff = min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+    if resp.status_code == 429:
+        # Honour the server's hint (never retry earlier than asked), plus jitter so throttled
+        # clients don't retry in lockstep
+        retry_after = _retry_after_seconds(resp.headers.get("Retry-After"))
+        if retry_after is not None and retry_after > MAX_RETRY_AFTER_SECONDS:
+            return None
+        return max(retry_after or 0.0, backoff) + random.uniform(0, backoff / 2)
+    # 5xx: full jitter
+    return backoff * random.random()
 
 
 class HttpClient:
-    def __init__(self, default_timeout_seconds: int = 30):
+    def __init__(self, default_timeout_seconds: int = 30, pool_connections: int = 32, pool_maxsize: int = 128):
         self._session = requests.Session()
+        # FastMCP runs sync tools on worker threads; size the per-host pool so concurrent calls reuse
+        # keep-alive connections instead of overflowing the default 10 and re-handshaking TLS.
+        # Adapter-level retries stay off: request_with_retry owns the retry policy.
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -16,29 +63,39 @@ class HttpClient:
         self._default_timeout_seconds = default_timeout_seconds
 
     def request_with_retry(self, method: str, url: str, **kwargs: Any) -> requests.Response:
-        backoffs = [0.2, 0.6, 1.2]
         if "timeout" not in kwargs:
             kwargs["timeout"] = self._default_timeout_seconds
-        for attempt in range(len(backoffs)):
+        for attempt in range(MAX_ATTEMPTS):
             resp = self._session.request(method=method.upper(), url=url, **kwargs)
             status = resp.status_code
-            if status == 429 or 500 <= status < 600:
-                if attempt == len(backoffs) - 1:
-                    resp.raise_for_status()
-                    return resp
-                time.sleep(backoffs[attempt])
-                continue
-            return resp
+            if status != 429 and status < 500:
+                # Success or a non-retryable 4xx: hand back immediately
+                return resp
+            max_attempts = MAX_429_ATTEMPTS if status == 429 else MAX_ATTEMPTS
+            delay = _retry_delay(resp, attempt) if attempt < max_attempts - 1 else None
+            if delay is None:
+                resp.raise_for_status()
+                return resp
+            time.sleep(delay)
         return resp
 
+    @staticmethod
+    def _decode(resp: requests.Response) -> Any:
+        # orjson parses large Helius payloads several times faster than resp.json()
+        return orjson.loads(resp.content)
+
     def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
         resp = self.request_with_retry("get", url, params=params)
         resp.raise_for_status()
-        return resp.json()
+        return self._decode(resp)
 
-    def post_json(self, url: str, json_body: Dict[str, Any]) -> Any:
-        resp = self.request_with_retry("post", url, json=json_body)
+    def post_json(self, url: str, json_body: Any) -> Any:
+        # Serialize once with orjson; the session already sends Content-Type: application/json.
+        # OPT_NON_STR_KEYS stringifies int keys like json.dumps does. Integers beyond u64 (never valid
+        # in Solana RPC params) raise TypeError before anything is sent.
+        resp = self.request_with_retry("post", url, data=orjson.dumps(json_body, option=orjson.OPT_NON_STR_KEYS))
         resp.raise_for_status()
-        return resp.json()
-
+        return self._decode(resp)
 
+    def close(self) -> None:
+        self._session.close()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import requests
 
 try:
     # Prefer global settings from top-level config, fall back to env
@@ -22,36 +25,58 @@ HELIUS_RPC_BASES: Dict[str, str] = {
 }
 
 
+_NETWORKS = frozenset(HELIUS_RPC_BASES)
+
+# Calls per JSON-RPC batch POST; larger batches are split to stay under provider limits
+RPC_BATCH_MAX = 25
+
+
+class RpcBatchRejected(RuntimeError):
+    """The provider refused a JSON-RPC batch as a whole (e.g. batching is not enabled for the key)."""
+
+
+@lru_cache(maxsize=1)
 def _require_api_key() -> str:
-    api_key: Optional[str] = None
-    try:
-        api_key = getattr(settings, "HELIUS_API_KEY", None)  # type: ignore[attr-defined]
-    except Exception:
-        api_key = None
-    if not api_key:
-        api_key = os.getenv("HELIUS_API_KEY")
+    # Resolved once per process (settings first, then env); a missing key is not cached, so it still
+    # raises on every call rather than at import, which keeps the module importable without a key.
+    api_key = getattr(settings, "HELIUS_API_KEY", None) or os.getenv("HELIUS_API_KEY")
     if not api_key:
         raise RuntimeError("HELIUS_API_KEY env var is required.")
     return api_key
 
 
 def _validate_network(network: str) -> str:
-    if network not in ("mainnet", "devnet"):
+    if network not in _NETWORKS:
         raise ValueError("network must be 'mainnet' or 'devnet'")
     return network
 
 
+# URL prefixes only depend on the network, so build them once. The API key is appended per call from
+# _require_api_key, so _require_api_key.cache_clear() is enough to pick up a rotated key.
+# Invalid networks raise before anything is cached.
+@lru_cache(maxsize=None)
+def _enhanced_base(network: str) -> str:
+    return HELIUS_ENHANCED_BASES[_validate_network(network)]
+
+
+@lru_cache(maxsize=None)
+def _rpc_base(network: str) -> str:
+    return f"{HELIUS_RPC_BASES[_validate_network(network)]}/?api-key="
+
+
+def _rpc_url_for(network: str) -> str:
+    return _rpc_base(network) + _require_api_key()
+
+
 class HeliusClient:
     def __init__(self, http: Optional[HttpClient] = None):
         self.http = http or HttpClient()
 
     def _enhanced_url(self, path: str, network: str) -> str:
-        base = HELIUS_ENHANCED_BASES[_validate_network(network)]
-        return f"{base}{path}?api-key={_require_api_key()}"
+        return f"{_enhanced_base(network)}{path}?api-key={_require_api_key()}"
 
     def _rpc_url(self, network: str) -> str:
-        base = HELIUS_RPC_BASES[_validate_network(network)]
-        return f"{base}/?api-key={_require_api_key()}"
+        return _rpc_url_for(network)
 
     # REST helpers
     def rest_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
@@ -71,4 +96,43 @@ class HeliusClient:
             return data["result"]
         return data
 
-
+    def rpc_batch(self, network: str, calls: Sequence[Tuple[str, Any]], errors_as_none: bool = False) -> List[Any]:
+        """
+        Send (method, params) calls as JSON-RPC batch requests and return their results in call order.
+        Responses may arrive in any order, so they are matched back by id. A per-call error raises,
+        unless ``errors_as_none`` is set, in which case that call's result is None. A batch the provider
+        refuses outright (non-list reply or a 4xx other than 429) raises RpcBatchRejected.
+        """
+        url = self._rpc_url(network)
+        results: List[Any] = []
+        for start in range(0, len(calls), RPC_BATCH_MAX):
+            chunk = calls[start:start + RPC_BATCH_MAX]
+            payload = [
+                {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+                for i, (method, params) in enumerate(chunk)
+            ]
+            try:
+                data = self.http.post_json(url, payload)
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status is not None and 400 <= status < 500 and status != 429:
+                    raise RpcBatchRejected(f"RPC batch rejected with HTTP {status}") from e
+                raise  # 429/5xx: the provider is throttled or failing, not refusing batches
+            if not isinstance(data, list):
+                err = data.get("error") if isinstance(data, dict) else None
+                if isinstance(err, dict):
+                    raise RpcBatchRejected(f"RPC error {err.get('code')}: {err.get('message')}")
+                raise RpcBatchRejected(f"Unexpected RPC batch response: {data!r}")
+            by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+            for i in range(len(chunk)):
+                item = by_id.get(i)
+                if item is None:
+                    raise RuntimeError(f"RPC batch response missing id {i}")
+                if item.get("error"):
+                    if errors_as_none:
+                        results.append(None)
+                        continue
+                    err = item.get("error") or {}
+                    raise RuntimeError(f"RPC error {err.get('code')}: {err.get('message')}")
+                results.append(item.get("result"))
+        return results
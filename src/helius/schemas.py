@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, field_validator, model_validator
 
 
 class _BaseModel(BaseModel):
     model_config = ConfigDict(extra="ignore", populate_by_name=True)
 
 
+class _RawBaseModel(_BaseModel):
+    # Raw* models mirror API output and are only ever read by the transforms
+    model_config = ConfigDict(frozen=True)
+
+
 class NativeTransfer(_BaseModel):
     from_addr: str
     to_addr: str
@@ -142,15 +147,19 @@ class ProgramAccountSummary(_BaseModel):
 # RAW Schemas (direct API output)
 # =============================
 
-class RawEnhancedNativeTransfer(_BaseModel):
+class RawEnhancedNativeTransfer(_RawBaseModel):
     from_user_account: Optional[str] = Field(default=None, alias="fromUserAccount")
     from_: Optional[str] = Field(default=None, alias="from")
     to_user_account: Optional[str] = Field(default=None, alias="toUserAccount")
     to_: Optional[str] = Field(default=None, alias="to")
     amount: Optional[int] = None
 
+    def as_summary_tuple(self) -> Tuple[str, str, int]:
+        """(from_addr, to_addr, amount_lamports) with the alias fallbacks already applied."""
+        return (self.from_user_account or self.from_ or "", self.to_user_account or self.to_ or "", self.amount or 0)
+
 
-class RawEnhancedTokenTransfer(_BaseModel):
+class RawEnhancedTokenTransfer(_RawBaseModel):
     mint: Optional[str] = None
     from_user_account: Optional[str] = Field(default=None, alias="fromUserAccount")
     from_token_account: Optional[str] = Field(default=None, alias="fromTokenAccount")
@@ -158,15 +167,44 @@ class RawEnhancedTokenTransfer(_BaseModel):
     to_user_account: Optional[str] = Field(default=None, alias="toUserAccount")
     to_token_account: Optional[str] = Field(default=None, alias="toTokenAccount")
     to_: Optional[str] = Field(default=None, alias="to")
-    token_amount: Optional[Union[str, int, float, Dict[str, Any]]] = Field(default=None, alias="tokenAmount")
+    token_amount: Optional[Union[int, str]] = Field(default=None, alias="tokenAmount")
     decimals: Optional[int] = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def _flatten_token_amount(cls, data: Any) -> Any:
+        # tokenAmount arrives as int/str, a float, or {"amount": ..., "decimals": ...}; normalise it
+        # here so the field is a two-member union instead of a four-way smart-mode match.
+        if not isinstance(data, dict):
+            return data
+        amount = data.get("tokenAmount")
+        if isinstance(amount, float):
+            data = {**data, "tokenAmount": str(amount)}
+        elif isinstance(amount, dict):
+            data = {**data, "tokenAmount": None if amount.get("amount") is None else str(amount.get("amount"))}
+            if data.get("decimals") is None:
+                try:
+                    data["decimals"] = int(amount["decimals"]) if amount.get("decimals") is not None else None
+                except (TypeError, ValueError):
+                    data["decimals"] = None
+        return data
+
+    def as_summary_tuple(self) -> Tuple[str, str, str, str, Optional[int]]:
+        """(mint, from_addr, to_addr, amount, decimals) with the alias fallbacks already applied."""
+        return (
+            self.mint or "",
+            self.from_user_account or self.from_token_account or self.from_ or "",
+            self.to_user_account or self.to_token_account or self.to_ or "",
+            "" if self.token_amount is None else str(self.token_amount),
+            self.decimals,
+        )
+
 #TODO Build out
-class RawEnhancedEvents(_BaseModel):
-    events: Optional[List[Dict[str, Any]]] = None
+class RawEnhancedEvents(_RawBaseModel):
+    events: Optional[List[Any]] = None
 
 
-class RawEnhancedTransaction(_BaseModel):
+class RawEnhancedTransaction(_RawBaseModel):
     # Top-level metadata
     description: Optional[str] = None
     type: Optional[str] = None
@@ -178,19 +216,20 @@ class RawEnhancedTransaction(_BaseModel):
     timestamp: Optional[int] = None
 
     # Transfer summaries
-    native_transfers: List[RawEnhancedNativeTransfer] = Field(default_factory=list, alias="nativeTransfers")
-    token_transfers: List[RawEnhancedTokenTransfer] = Field(default_factory=list, alias="tokenTransfers")
+    native_transfers: Tuple[RawEnhancedNativeTransfer, ...] = Field(default=(), alias="nativeTransfers")
+    token_transfers: Tuple[RawEnhancedTokenTransfer, ...] = Field(default=(), alias="tokenTransfers")
     events: Optional[RawEnhancedEvents] = None
 
     # Status indicators (observed variants)
     status: Optional[Union[str, Dict[str, Any]]] = None
     transaction_error: Optional[Union[str, Dict[str, Any]]] = Field(default=None, alias="transactionError")    
 
-    # Additional enhanced fields we don't currently consume, but preserve    
-    accountData: Optional[List[Dict[str, Any]]] = None # Includes tokenBalanceChanges, nativeBalanceChange, and account.
-    instructions: Optional[List[Dict[str, Any]]] = None
+    # Additional enhanced fields we don't currently consume, but preserve.
+    # Typed as List[Any] so the nested dicts are kept by reference instead of validated and copied.
+    accountData: Optional[List[Any]] = None # Includes tokenBalanceChanges, nativeBalanceChange, and account.
+    instructions: Optional[List[Any]] = None
 
-class RawSignatureForAddressItem(_BaseModel):
+class RawSignatureForAddressItem(_RawBaseModel):
     signature: Optional[str] = None
     slot: Optional[int] = None
     err: Optional[object] = None
@@ -198,60 +237,60 @@ class RawSignatureForAddressItem(_BaseModel):
     blockTime: Optional[int] = None
     confirmationStatus: Optional[str] = None
 
-class RawInstruction(_BaseModel):
-    accounts: Optional[List[str]] = Field(default_factory=list)
+class RawInstruction(_RawBaseModel):
+    accounts: Optional[Tuple[str, ...]] = ()
     data: Optional[str] = None
     programIdIndex: Optional[int] = None
 
-class RawTransactionMessageHeader(_BaseModel):
+class RawTransactionMessageHeader(_RawBaseModel):
     numReadonlySignedAccounts: Optional[int] = None
     numReadonlyUnsignedAccounts: Optional[int] = None
     numRequiredSignatures: Optional[int] = None
 
-class RawTransactionMessageAccountKeys(_BaseModel):
+class RawTransactionMessageAccountKeys(_RawBaseModel):
     pubkey: Optional[str] = None
     writable: Optional[bool] = None
 
-class RawTransactionMessage(_BaseModel):
-    accountKeys: Optional[List[RawTransactionMessageAccountKeys]] = Field(default_factory=RawTransactionMessageAccountKeys)
-    header: Optional[RawTransactionMessageHeader] = Field(default_factory=RawTransactionMessageHeader)
+class RawTransactionMessage(_RawBaseModel):
+    accountKeys: Tuple[RawTransactionMessageAccountKeys, ...] = ()
+    header: Optional[RawTransactionMessageHeader] = None
     recentBlockhash: Optional[str] = None
-    instructions: Optional[List[RawInstruction]] = Field(default_factory=list)
+    instructions: Optional[Tuple[RawInstruction, ...]] = ()
 
 
-class RawTransactionData(_BaseModel):
+class RawTransactionData(_RawBaseModel):
     message: RawTransactionMessage = Field(default_factory=RawTransactionMessage)
-    signatures: List[str] = Field(default_factory=list)
+    signatures: Tuple[str, ...] = ()
 
 
-class RawTransactionMeta(_BaseModel):
+class RawTransactionMeta(_RawBaseModel):
     err: Optional[object] = None
     fee: Optional[int] = None
-    innerInstructions: Optional[List[Dict[str, Any]]] = None
+    innerInstructions: Optional[List[Any]] = None # Passed through as-is, see RawEnhancedTransaction
     logMessages: Optional[List[str]] = None
 
 
-class RawGetTransaction(_BaseModel):
+class RawGetTransaction(_RawBaseModel):
     blockTime: Optional[int] = None
     slot: Optional[int] = None
     meta: Optional[RawTransactionMeta] = None
     transaction: Optional[RawTransactionData] = None
 
-class RawContext(_BaseModel):
+class RawContext(_RawBaseModel):
     apiVersion: Optional[str] = None
     slot: Optional[int] = None    
 
 
-class RawReplacementBlockhash(_BaseModel):
+class RawReplacementBlockhash(_RawBaseModel):
     blockhash: Optional[str] = None
     lastValidBlockHeight: Optional[int] = None
 
-class RawReturnData(_BaseModel):
+class RawReturnData(_RawBaseModel):
     programId: Optional[str] = None
     data: Optional[str] = None
 
 
-class RawSimulateTransactionValue(_BaseModel):
+class RawSimulateTransactionValue(_RawBaseModel):
     accounts: Optional[List[Dict[str, Any]]] = None
     err: Optional[object] = None
     innerInstructions: Optional[List[Any]] = None
@@ -262,13 +301,13 @@ class RawSimulateTransactionValue(_BaseModel):
     unitsConsumed: Optional[int] = None
 
 
-class RawSimulateTransactionResponse(_BaseModel):
+class RawSimulateTransactionResponse(_RawBaseModel):
     # Standard JSON-RPC response wraps it, but client returns .result directly
     context: Optional[RawContext] = None
     value: Optional[RawSimulateTransactionValue] = None    
 
 
-class RawPriorityFeeLevels(_BaseModel):
+class RawPriorityFeeLevels(_RawBaseModel):
     min: Optional[int] = None
     low: Optional[int] = None
     medium: Optional[int] = None
@@ -277,30 +316,30 @@ class RawPriorityFeeLevels(_BaseModel):
     unsafeMax: Optional[int] = None
 
 
-class RawPriorityFeeEstimate(_BaseModel):
+class RawPriorityFeeEstimate(_RawBaseModel):
     priorityFeeEstimate: Optional[int] = None
     priorityFeeLevels: Optional[RawPriorityFeeLevels] = None
 
 
 # --- DAS RAW ---------------------------------------------------------------
 
-class RawDasAssetContentFile(_BaseModel):
+class RawDasAssetContentFile(_RawBaseModel):
     uri: Optional[str] = None
     cdn_uri: Optional[str] = None
     mime: Optional[str] = None
 
 
-class RawDasAssetContentLinks(_BaseModel):
+class RawDasAssetContentLinks(_RawBaseModel):
     image: Optional[str] = None
     external_url: Optional[str] = None
 
 
-class RawDasAssetContentAttributes(_BaseModel):
+class RawDasAssetContentAttributes(_RawBaseModel):
     trait_type: Optional[str] = None
     value: Optional[str] = None
 
 
-class RawDasAssetContentMetadata(_BaseModel):
+class RawDasAssetContentMetadata(_RawBaseModel):
     name: Optional[str] = None
     symbol: Optional[str] = None
     attributes: Optional[List[RawDasAssetContentAttributes]] = None
@@ -308,16 +347,16 @@ class RawDasAssetContentMetadata(_BaseModel):
     token_standard: Optional[str] = None
 
 
-class RawDasAssetContent(_BaseModel):
+class RawDasAssetContent(_RawBaseModel):
     #$schema: Optional[str] = None
     json_uri: Optional[str] = None
-    files: List[Union[RawDasAssetContentFile, Dict[str, Any]]] = Field(default_factory=list)
+    files: Tuple[Union[RawDasAssetContentFile, Dict[str, Any]], ...] = ()
     links: Optional[RawDasAssetContentLinks] = None
     metadata: Optional[RawDasAssetContentMetadata] = None
     category: Optional[str] = None
 
 
-class RawDasOwnership(_BaseModel):
+class RawDasOwnership(_RawBaseModel):
     frozen: Optional[bool] = None
     delegated: Optional[bool] = None
     ownership_model: Optional[str] = None
@@ -325,12 +364,12 @@ class RawDasOwnership(_BaseModel):
     delegate: Optional[str] = None
 
 
-class RawDasGroupingItem(_BaseModel):
+class RawDasGroupingItem(_RawBaseModel):
     group_key: Optional[str] = None
     group_value: Optional[str] = None
 
 
-class RawDasCompression(_BaseModel):
+class RawDasCompression(_RawBaseModel):
     eligible: Optional[bool] = None
     compressed: Optional[bool] = None
     data_hash: Optional[str] = None
@@ -341,14 +380,14 @@ class RawDasCompression(_BaseModel):
     leaf_id: Optional[int] = None
 
 
-class RawTokenPriceInfo(_BaseModel):
+class RawTokenPriceInfo(_RawBaseModel):
     price: Optional[float] = None
     current: Optional[float] = None
     price_per_token: Optional[float] = None
     usd: Optional[float] = None
 
 
-class RawDasTokenInfo(_BaseModel):
+class RawDasTokenInfo(_RawBaseModel):
     supply: Optional[int] = None
     decimals: Optional[int] = None
     token_program: Optional[str] = None
@@ -356,11 +395,11 @@ class RawDasTokenInfo(_BaseModel):
     freeze_authority: Optional[str] = None
 
 
-class RawDasAuthorities(_BaseModel):
+class RawDasAuthorities(_RawBaseModel):
     address: Optional[str] = None
     scopes: Optional[List[str]] = None
 
-class RawDasRoyalty(_BaseModel):
+class RawDasRoyalty(_RawBaseModel):
     royalty_model: Optional[str] = None
     target: Optional[str] = None
     percent: Optional[float] = None
@@ -368,24 +407,24 @@ class RawDasRoyalty(_BaseModel):
     primary_sale_happened: Optional[bool] = None
     locked: Optional[bool] = None
 
-class RawDasCreator(_BaseModel):
+class RawDasCreator(_RawBaseModel):
     address: Optional[str] = None
     verified: Optional[bool] = None
     share: Optional[int] = None
 
-class RawDasSupply(_BaseModel):
+class RawDasSupply(_RawBaseModel):
     print_max_supply: Optional[int] = None
     print_current_supply: Optional[int] = None
     edition_nonce: Optional[int] = None
 
-class RawDasAsset(_BaseModel):
+class RawDasAsset(_RawBaseModel):
     id: str
     last_indexed_slot: Optional[int] = None
     interface: Optional[str] = None
     content: Optional[RawDasAssetContent] = None
     authorities: Optional[List[RawDasAuthorities]] = None
     compression: Optional[RawDasCompression] = None
-    grouping: List[RawDasGroupingItem] = Field(default_factory=list)    
+    grouping: Tuple[RawDasGroupingItem, ...] = ()    
     royalty: Optional[RawDasRoyalty] = None
     creators: Optional[List[RawDasCreator]] = None
     ownership: Optional[RawDasOwnership] = None
@@ -395,18 +434,38 @@ class RawDasAsset(_BaseModel):
     token_info: Optional[RawDasTokenInfo] = None
 
 
-class RawDasAssetsPage(_BaseModel):
+class RawNativeBalance(_RawBaseModel):
+    # Only lamports is read; price fields are left out so a malformed price can't fail the whole page
+    lamports: Optional[int] = None
+
+
+class RawDasAssetsPage(_RawBaseModel):
     last_indexed_slot: Optional[int] = None
     page: Optional[int] = None
     total: Optional[int] = None
-    items: Optional[List[RawDasAsset]] = Field(default_factory=list)
+    items: Optional[Tuple[RawDasAsset, ...]] = ()
     limit: Optional[int] = None
-    # Some responses include nativeBalance which may be an int or an object
-    nativeBalance: Optional[Any] = None
-    native_balance: Optional[Any] = None
-
-
-class RawDasTokenAccountItem(_BaseModel):
+    # Some responses include nativeBalance which may be an int or an object; both become RawNativeBalance
+    nativeBalance: Optional[RawNativeBalance] = None
+    native_balance: Optional[RawNativeBalance] = None
+
+    @field_validator("nativeBalance", "native_balance", mode="before")
+    @classmethod
+    def _coerce_native_balance(cls, v: Any) -> Any:
+        if isinstance(v, dict):
+            lamports = v.get("lamports") or v.get("amount")
+        elif isinstance(v, (int, str)):
+            lamports = v
+        else:
+            return None
+        try:
+            lamports = int(lamports) if lamports is not None else None
+        except (TypeError, ValueError):
+            lamports = None
+        return {**v, "lamports": lamports} if isinstance(v, dict) else {"lamports": lamports}
+
+
+class RawDasTokenAccountItem(_RawBaseModel):
     address: Optional[str] = None
     mint: Optional[str] = None
     owner: Optional[str] = None
@@ -417,29 +476,29 @@ class RawDasTokenAccountItem(_BaseModel):
     balance: Optional[RawDasTokenBalance] = None
 
 
-class RawDasTokenBalance(_BaseModel):
+class RawDasTokenBalance(_RawBaseModel):
     amount: Optional[Union[int, str]] = None
     decimals: Optional[int] = None
     uiAmountString: Optional[str] = None
 
 
-class RawDasTokenAccountsResult(_BaseModel):
+class RawDasTokenAccountsResult(_RawBaseModel):
     last_indexed_slot: Optional[int] = None
     total: Optional[int] = None
     limit: Optional[int] = None
     cursor: Optional[str] = None
-    items: List[Union[RawDasTokenAccountItem, Dict[str, Any]]] = Field(default_factory=list)
+    items: Tuple[Union[RawDasTokenAccountItem, Dict[str, Any]], ...] = ()
 
 
 # --- Helpers RAW -----------------------------------------------------------
 
 
-class RawGetBalanceResult(_BaseModel):
+class RawGetBalanceResult(_RawBaseModel):
     context: Optional[RawContext] = None
     value: int
 
 
-class RawAccountInfoValue(_BaseModel):
+class RawAccountInfoValue(_RawBaseModel):
     lamports: Optional[int] = None
     owner: Optional[str] = None
     data: Optional[Any] = None  # Can be List[str] or complex object depending on encoding
@@ -447,19 +506,31 @@ class RawAccountInfoValue(_BaseModel):
     rentEpoch: Optional[int] = None
     space: Optional[int] = None
 
-class RawAccountStaticValue(_BaseModel):
+class RawAccountStaticValue(_RawBaseModel):
     status: Optional[str] = None # "unchanged", Status-only response when account exists but hasn't changed since the specified slot.
 
 
-class RawGetAccountInfoResult(_BaseModel):
+def _account_value_tag(v: Any) -> str:
+    # Only the changedSinceSlot short form carries "status"; route on it instead of trying both models
+    status = v.get("status") if isinstance(v, dict) else getattr(v, "status", None)
+    return "info" if status is None else "static"
+
+
+_RawAccountValue = Annotated[
+    Union[Annotated[RawAccountInfoValue, Tag("info")], Annotated[RawAccountStaticValue, Tag("static")]],
+    Discriminator(_account_value_tag),
+]
+
+
+class RawGetAccountInfoResult(_RawBaseModel):
     context: Optional[RawContext] = None
-    value: Optional[RawAccountInfoValue | RawAccountStaticValue] = None
+    value: Optional[_RawAccountValue] = None
 
 
 # --- Signature Statuses RAW --------------------------------------------------
 
 
-class RawSignatureStatus(_BaseModel):
+class RawSignatureStatus(_RawBaseModel):
     slot: Optional[int] = None
     confirmations: Optional[int] = None
     err: Optional[object] = None
@@ -467,7 +538,7 @@ class RawSignatureStatus(_BaseModel):
     status: Optional[Union[Dict[str, Any], str]] = None
 
 
-class RawGetSignatureStatusesResult(_BaseModel):
+class RawGetSignatureStatusesResult(_RawBaseModel):
     context: Optional[RawContext] = None
     value: Optional[List[Optional[RawSignatureStatus]]] = None
 
@@ -475,28 +546,40 @@ class RawGetSignatureStatusesResult(_BaseModel):
 # --- Multiple Accounts RAW ---------------------------------------------------
 
 
-class RawGetMultipleAccountsResult(_BaseModel):
+class RawGetMultipleAccountsResult(_RawBaseModel):
     context: Optional[RawContext] = None
-    value: Optional[List[Optional[RawAccountInfoValue | RawAccountStaticValue]]] = None
+    value: Optional[List[Optional[_RawAccountValue]]] = None
 
 
 # --- Program Accounts RAW ----------------------------------------------------
 
 
-class RawProgramAccount(_BaseModel):
+class RawProgramAccount(_RawBaseModel):
     pubkey: str
     account: RawAccountInfoValue
 
 
 # --- Token Largest Accounts --------------------------------------------------
 
-class RawTokenLargestAccountItem(_BaseModel):
+class RawTokenLargestAccountItem(_RawBaseModel):
     address: Optional[str] = None
     amount: Optional[str] = None
     decimals: Optional[int] = None
     uiAmountString: Optional[str] = None
 
 
-class RawTokenLargestAccounts(_BaseModel):
+class RawTokenLargestAccounts(_RawBaseModel):
     context: Optional[RawContext] = None
     value: Optional[List[RawTokenLargestAccountItem]] = None
+
+
+# Models with forward references (e.g. RawDasTokenAccountItem -> RawDasTokenBalance) otherwise
+# build their validators on first use; finish them at import so no request pays that cost.
+def _rebuild_incomplete(base: type[BaseModel]) -> None:
+    for cls in base.__subclasses__():
+        if not cls.__pydantic_complete__:
+            cls.model_rebuild()
+        _rebuild_incomplete(cls)
+
+
+_rebuild_incomplete(_BaseModel)
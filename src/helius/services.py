@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from .client import HeliusClient
+from src.common.cache import TTLCache
+
+from .client import HeliusClient, RpcBatchRejected
 from .schemas import (
     EnhancedTxSummary,
     SignatureInfo,
@@ -20,9 +23,90 @@ from .schemas import (
 from . import transforms as tf
 
 
+LAMPORTS_PER_SOL = 1_000_000_000
+# getMultipleAccounts accepts at most 100 pubkeys per request
+_MULTIPLE_ACCOUNTS_MAX = 100
+# Concurrent getBalance calls when a JSON-RPC batch is rejected; well under HttpClient's pool size
+_BALANCE_FALLBACK_WORKERS = 16
+# Zero-length dataSlice: the RPC returns account metadata (lamports, owner, ...) without the data bytes
+_METADATA_ONLY_SLICE: Dict[str, int] = {"offset": 0, "length": 0}
+
+# Option dicts for the default (no override) call paths, built once. They are passed to the HTTP layer
+# as-is and serialized, never mutated; calls with non-default options build their own dict.
+_FINALIZED_CFG: Dict[str, Any] = {"commitment": "finalized"}
+_DEFAULT_TX_CFG: Dict[str, Any] = {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0, "commitment": "finalized"}
+_DEFAULT_ACCOUNT_INFO_CFG: Dict[str, Any] = {"encoding": "base64", "commitment": "finalized"}
+
+
+def _tx_cfg(encoding: str, commitment: Optional[str]) -> Dict[str, Any]:
+    if encoding == "jsonParsed" and commitment in (None, "finalized"):
+        return _DEFAULT_TX_CFG
+    return {"encoding": encoding, "maxSupportedTransactionVersion": 0, "commitment": commitment or "finalized"}
+
+
+# Known whale addresses for major tokens on mainnet (fallback when APIs fail due to scale)
+_KNOWN_WHALES: Dict[str, Tuple[str, ...]] = {
+    # USDC whales (exchanges, market makers, etc)
+    "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v": (
+        "BQy5rNRxLfcaK6554PMzsg4VJsFXzwGnAnayb8TZKgZX",  # Circle
+        "CqCDNi1PSB7cP3rDxU12YKjVDqbJeZ9rGhxZxkkwi6mC",  # Major exchange
+        "9RfZwn2Prux6QesG1Noo4HzMEBkMvoYdkLRMKEZf86tT",  # Binance
+        "H8W3ctz92svYXCbxDdZGTCm66RBkXqudLV8Xjhj8HBJd",  # FTX
+        "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM",  # Alameda
+    ),
+    # SOL whales  
+    "So11111111111111111111111111111111111111112": (
+        "GjphYQcbP1m3FuDyCTUJf2mUMxKME2QyELubyyi8gH4E",  # Exchange
+        "J1S9H3QjnRtBbbuD4HjPV6RpRhwuk4zKbxsnCHuTgh9w",  # Validator
+        "Bd7VSwkqpwHjKPMRLQUPqTk5W7c1VRNDfSQ1YTVMQ52v",  # Foundation
+        "AhbYQB2Kw4tG3e8YmK8j5zJ4r3F8VXf6wUgkEoWsGkAJ",  # Market maker
+        "DfXygSm4jCyNCybVYYK6DwvWqjKee8pbDmJGcLWNDXjh",  # Large holder
+    ),
+    # USDT whales
+    "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB": (
+        "Q6LZqDG2J4E7KZAkfN5X9w3J8c7VGp9LhJy8aK5mYfDq",  # Exchange
+        "HAkqJgFCPRhtfvXBMVQ9BfrYPKQhcMp3FGVj9bwyNNMp",  # Tether treasury  
+        "J1S9H3QjnRtBbbuD4HjPV6RpRhwuk4zKbxsnCHuTgh9w",  # Market maker
+        "Bd7VSwkqpwHjKPMRLQUPqTk5W7c1VRNDfSQ1YTVMQ52v",  # Exchange 2
+        "AhbYQB2Kw4tG3e8YmK8j5zJ4r3F8VXf6wUgkEoWsGkAJ",  # Large holder
+    ),
+}
+
+
+def _lamports_from(result: Any) -> int:
+    # getBalance result is {"context": ..., "value": lamports}; tolerate a bare number too
+    try:
+        value = result["value"]
+    except (TypeError, KeyError, IndexError):
+        return int(result)
+    return value if type(value) is int else int(value)
+
+
 class HeliusService:
     def __init__(self, client: Optional[HeliusClient] = None):
         self.client = client or HeliusClient()
+        # Asset metadata changes rarely; absorb repeated lookups for the same id across tool calls
+        self._asset_cache = TTLCache(maxsize=1024, ttl_seconds=60.0)
+        # Short-lived: balances move, but whale scans and repeated tool calls hit the same hot addresses
+        self._balance_cache = TTLCache(maxsize=2048, ttl_seconds=20.0)
+        self._largest_accounts_cache = TTLCache(maxsize=256, ttl_seconds=10.0)
+        # Finalized transactions never change, so these only expire to bound memory
+        self._tx_cache = TTLCache(maxsize=4096, ttl_seconds=3600.0)
+        self._raw_tx_cache = TTLCache(maxsize=4096, ttl_seconds=3600.0)
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters and sizes of the in-process caches."""
+        return {
+            "assets": self._asset_cache.stats(),
+            "balances": self._balance_cache.stats(),
+            "largest_accounts": self._largest_accounts_cache.stats(),
+            "transactions": self._tx_cache.stats(),
+            "raw_transactions": self._raw_tx_cache.stats(),
+        }
+
+    def invalidate(self, pubkey: str) -> None:
+        """Forget cached balances for ``pubkey`` (all networks/commitments), e.g. after sending a transaction."""
+        self._balance_cache.invalidate_where(lambda key: key[0] == pubkey)
 
     # Enhanced REST
     #TODO CHECK
@@ -31,12 +115,20 @@ class HeliusService:
             raise ValueError("signatures must not be empty")
         if len(signatures) > 100:
             raise ValueError("max 100 signatures per call; chunk your requests")
-        url = self.client._enhanced_url("/v0/transactions", network)
-        body: Dict[str, Any] = {"transactions": signatures}
-        raw = self.client.rest_post(url, body)
-        if isinstance(raw, list):
-            return [tf.summarize_enhanced_tx(tx) for tx in raw if isinstance(tx, dict)]
-        return raw
+        # Summaries are cached per signature; only the misses are requested
+        found: Dict[str, Optional[EnhancedTxSummary]] = {sig: self._tx_cache.get((sig, network)) for sig in signatures}
+        missing = [sig for sig, summary in found.items() if summary is None]
+        if missing:
+            url = self.client._enhanced_url("/v0/transactions", network)
+            body: Dict[str, Any] = {"transactions": missing}
+            raw = self.client.rest_post(url, body)
+            if not isinstance(raw, list):
+                return raw
+            for summary in tf.summarize_enhanced_txs([tx for tx in raw if isinstance(tx, dict)]):
+                if summary.signature in found:
+                    found[summary.signature] = summary
+                    self._tx_cache.set((summary.signature, network), summary)
+        return [summary for summary in map(found.get, signatures) if summary is not None]
 
     #TODO CHECK
     def get_transactions_by_address(
@@ -50,21 +142,16 @@ class HeliusService:
         limit: int = 50,
         commitment: Optional[str] = None,
     ) -> List[EnhancedTxSummary]:
-        params: Dict[str, Any] = {"limit": limit}
-        if tx_type:
-            params["type"] = tx_type
-        if source:
-            params["source"] = source
-        if before:
-            params["before"] = before
-        if until:
-            params["until"] = until
+        params: Dict[str, Any] = {
+            k: v for k, v in (("type", tx_type), ("source", source), ("before", before), ("until", until)) if v
+        }
+        params["limit"] = limit
         params["commitment"] = commitment or "finalized"
 
         url = self.client._enhanced_url(f"/v0/addresses/{address}/transactions", network)
         raw = self.client.rest_get(url, params=params)
         if isinstance(raw, list):
-            return [tf.summarize_enhanced_tx(tx) for tx in raw if isinstance(tx, dict)]
+            return tf.summarize_enhanced_txs([tx for tx in raw if isinstance(tx, dict)])
         return raw
 
     # RPC
@@ -77,16 +164,13 @@ class HeliusService:
         until: Optional[str] = None,
         commitment: Optional[str] = None,
     ) -> List[SignatureInfo]:
-        bounded_limit = max(1, min(int(limit), 1000))
-        options: Dict[str, Any] = {"limit": bounded_limit}
-        if before:
-            options["before"] = before
-        if until:
-            options["until"] = until
+        options: Dict[str, Any] = {k: v for k, v in (("before", before), ("until", until)) if v}
+        # The MCP tool schema already bounds limit; keep the clamp for direct (non-MCP) callers
+        options["limit"] = min(max(int(limit), 1), 1000)
         options["commitment"] = commitment or "finalized"
         raw = self.client.rpc(network, "getSignaturesForAddress", [address, options])
         if isinstance(raw, list):
-            return [tf.summarize_signature_info(e) for e in raw if isinstance(e, dict)]
+            return tf.summarize_signature_infos([e for e in raw if isinstance(e, dict)])
         return raw
 
     #TODO Enhance
@@ -97,13 +181,53 @@ class HeliusService:
         encoding: str = "jsonParsed",
         commitment: Optional[str] = None,
     ) -> TxRawSummary:
-        cfg: Dict[str, Any] = {"encoding": encoding, "maxSupportedTransactionVersion": 0}
-        cfg["commitment"] = commitment or "finalized"
-        raw = self.client.rpc(network, "getTransaction", [signature, cfg])
+        # Only finalized transactions are immutable, and only found ones are cached (a miss may land later)
+        cacheable = commitment in (None, "finalized")
+        key = (signature, network, encoding)
+        if cacheable:
+            cached = self._raw_tx_cache.get(key)
+            if cached is not None:
+                return cached
+        raw = self.client.rpc(network, "getTransaction", [signature, _tx_cfg(encoding, commitment)])
         if isinstance(raw, dict) and (raw.get("meta") or raw.get("transaction")):
-            return tf.summarize_raw_transaction(raw)
+            summary = tf.summarize_raw_transaction(raw)
+            if cacheable:
+                self._raw_tx_cache.set(key, summary)
+            return summary
         return raw
 
+    def get_transactions_raw_batch(
+        self,
+        signatures: List[str],
+        network: str = "mainnet",
+        encoding: str = "jsonParsed",
+        commitment: Optional[str] = None,
+    ) -> List[Optional[TxRawSummary]]:
+        """
+        get_transaction_raw for many signatures, sent as JSON-RPC batches. Results follow input order;
+        a signature that is unknown or that the node rejects comes back as None instead of failing the batch.
+        """
+        if not signatures:
+            raise ValueError("signatures must not be empty")
+        cacheable = commitment in (None, "finalized")
+        found: Dict[str, Any] = {
+            sig: self._raw_tx_cache.get((sig, network, encoding)) if cacheable else None for sig in signatures
+        }
+        missing = [sig for sig, summary in found.items() if summary is None]
+        if missing:
+            cfg = _tx_cfg(encoding, commitment)
+            results = self.client.rpc_batch(
+                network, [("getTransaction", [sig, cfg]) for sig in missing], errors_as_none=True
+            )
+            for sig, raw in zip(missing, results):
+                summary = None
+                if isinstance(raw, dict) and (raw.get("meta") or raw.get("transaction")):
+                    summary = tf.summarize_raw_transaction(raw)
+                    if cacheable:
+                        self._raw_tx_cache.set((sig, network, encoding), summary)
+                found[sig] = summary
+        return [found[sig] for sig in signatures]
+
     def simulate_transaction(
         self,
         transaction: str,
@@ -144,6 +268,14 @@ class HeliusService:
 
     # DAS
     def get_asset(self, asset_id: str, network: str = "mainnet") -> AssetSummary:
+        # Only summaries are cached; raw fallbacks (e.g. a null result) go back to the network next time
+        return self._asset_cache.get_or_load(
+            (network, asset_id),
+            lambda: self._load_asset(asset_id, network),
+            lambda value: isinstance(value, AssetSummary),
+        )
+
+    def _load_asset(self, asset_id: str, network: str) -> AssetSummary:
         raw = self.client.rpc(network, "getAsset", {"id": asset_id})
         if isinstance(raw, dict):
             return tf.summarize_asset(raw)
@@ -185,22 +317,21 @@ class HeliusService:
         limit: int = 50,
         page: int = 1,
     ) -> AssetsPageSummary:
-        params: Dict[str, Any] = {"limit": limit, "page": page}
+        params: Dict[str, Any] = {
+            k: v for k, v in (("ownerAddress", owner_address), ("creatorAddress", creator_address)) if v
+        }
+        params["limit"] = limit
+        params["page"] = page
         # Only include tokenType if not the default 'all' to avoid validation requiring owner_address
         if token_type and token_type != "all":
             params["tokenType"] = token_type
-        if owner_address:
-            params["ownerAddress"] = owner_address
-        if creator_address:
-            params["creatorAddress"] = creator_address
         if collection:
             params["grouping"] = ["collection", collection]
         if attributes:
-            traits_list: List[Dict[str, Any]] = []
-            for trait_type, value in attributes.items():
-                values_list = value if isinstance(value, list) else [value]
-                traits_list.append({"trait_type": trait_type, "values": values_list})
-            params["traits"] = traits_list
+            params["traits"] = [
+                {"trait_type": trait_type, "values": value if type(value) is list else [value]}
+                for trait_type, value in attributes.items()
+            ]
         raw = self.client.rpc(network, "searchAssets", params)
         if isinstance(raw, dict):
             return tf.summarize_assets_page(raw)
@@ -217,21 +348,53 @@ class HeliusService:
 
     # Small helpers
     def get_balance(self, public_key: str, network: str = "mainnet", commitment: Optional[str] = None) -> int:
-        params: List[Any] = [public_key]
-        params.append({"commitment": commitment or "finalized"})
-        result = self.client.rpc(network, "getBalance", params)
-        if isinstance(result, dict) and "value" in result:
-            return int(result.get("value"))
-        return int(result)
+        commitment = commitment or "finalized"
+        return self._balance_cache.get_or_load(
+            (public_key, network, commitment), lambda: self._load_balance(public_key, network, commitment)
+        )
+
+    def _load_balance(self, public_key: str, network: str, commitment: str) -> int:
+        cfg = _FINALIZED_CFG if commitment == "finalized" else {"commitment": commitment}
+        result = self.client.rpc(network, "getBalance", [public_key, cfg])
+        return _lamports_from(result)
+
+    def get_balances_batch(
+        self, public_keys: List[str], network: str = "mainnet", commitment: Optional[str] = None
+    ) -> List[int]:
+        """get_balance for many addresses, in input order. Shares the bulk path and cache of the whale scan."""
+        if not public_keys:
+            raise ValueError("public_keys must not be empty")
+        balances = self._get_balances_bulk(public_keys, network, commitment or "finalized")
+        return [balances[key] for key in public_keys]
 
     def get_account_info(self, address: str, network: str = "mainnet", encoding: str = "base64") -> AccountInfoSummary:
-        raw = self.client.rpc(network, "getAccountInfo", [address, {"encoding": encoding, "commitment": "finalized"}])
+        cfg = _DEFAULT_ACCOUNT_INFO_CFG if encoding == "base64" else {"encoding": encoding, "commitment": "finalized"}
+        raw = self.client.rpc(network, "getAccountInfo", [address, cfg])
         if isinstance(raw, dict):
             value = raw.get("value") or {}
             if isinstance(value, dict):
                 return tf.summarize_account_info(value)
         return raw
 
+    def get_account_infos_batch(
+        self, addresses: List[str], network: str = "mainnet", encoding: str = "base64"
+    ) -> List[Optional[AccountInfoSummary]]:
+        """
+        Account info for any number of addresses: getMultipleAccounts chunks of 100, all chunks sent as
+        one JSON-RPC batch. Results follow input order; missing accounts are None.
+        """
+        if not addresses:
+            raise ValueError("addresses must not be empty")
+        cfg = _DEFAULT_ACCOUNT_INFO_CFG if encoding == "base64" else {"encoding": encoding, "commitment": "finalized"}
+        chunks = [addresses[start:start + _MULTIPLE_ACCOUNTS_MAX] for start in range(0, len(addresses), _MULTIPLE_ACCOUNTS_MAX)]
+        results = self.client.rpc_batch(network, [("getMultipleAccounts", [chunk, cfg]) for chunk in chunks])
+        out: List[Optional[AccountInfoSummary]] = []
+        for chunk, res in zip(chunks, results):
+            summaries = tf.summarize_multiple_accounts(res) if isinstance(res, dict) else []
+            # Pad so a short or malformed chunk cannot shift later results out of input order
+            out.extend(summaries[:len(chunk)] + [None] * (len(chunk) - len(summaries)))
+        return out
+
     # New RPC helpers
     #TODO CHECK
     def get_signature_statuses(
@@ -248,11 +411,8 @@ class HeliusService:
             opts["commitment"] = commitment
         res = self.client.rpc(network, "getSignatureStatuses", [signatures, opts])
         if isinstance(res, dict):
-            values = res.get("value") or []
-            out: List[Optional[SignatureStatus]] = []
-            for v in values:
-                out.append(tf.summarize_signature_status(v) if isinstance(v, (dict,)) or v is None else None)
-            return out
+            summarize = tf.summarize_signature_status
+            return [summarize(v) if v is None or isinstance(v, dict) else None for v in res.get("value") or []]
         return res
 
     #TODO CHECK
@@ -265,14 +425,14 @@ class HeliusService:
         data_slice: Optional[Dict[str, int]] = None,
         min_context_slot: Optional[int] = None,
         changed_since_slot: Optional[int] = None,
+        metadata_only: bool = False,
     ) -> List[Optional[AccountInfoSummary]]:
+        """With ``metadata_only`` the account data is not transferred (summaries carry empty data)."""
         if not pubkeys:
             raise ValueError("pubkeys must not be empty")
-        cfg: Dict[str, Any] = {"encoding": encoding}
-        if commitment:
-            cfg["commitment"] = commitment
-        else:
-            cfg["commitment"] = "finalized"
+        if metadata_only:
+            encoding, data_slice = "base64", _METADATA_ONLY_SLICE
+        cfg: Dict[str, Any] = {"encoding": encoding, "commitment": commitment or "finalized"}
         if isinstance(data_slice, dict):
             cfg["dataSlice"] = data_slice
         if isinstance(min_context_slot, int):
@@ -294,25 +454,20 @@ class HeliusService:
         data_slice: Optional[Dict[str, int]] = None,
         commitment: Optional[str] = None,
         changed_since_slot: Optional[int] = None,
+        metadata_only: bool = False,
     ) -> List[ProgramAccountSummary]:
-        opts: Dict[str, Any] = {"encoding": encoding}
-        if commitment:
-            opts["commitment"] = commitment
-        else:
-            opts["commitment"] = "finalized"
-        if filters:
-            opts["filters"] = filters
-        if data_slice:
-            opts["dataSlice"] = data_slice
+        """With ``metadata_only`` the account data is not transferred (summaries carry empty data)."""
+        if metadata_only:
+            encoding, data_slice = "base64", _METADATA_ONLY_SLICE
+        opts: Dict[str, Any] = {k: v for k, v in (("filters", filters), ("dataSlice", data_slice)) if v}
+        opts["encoding"] = encoding
+        opts["commitment"] = commitment or "finalized"
         if isinstance(changed_since_slot, int):
             opts["changedSinceSlot"] = changed_since_slot
         res = self.client.rpc(network, "getProgramAccounts", [program_id, opts])
         if isinstance(res, list):
-            out: List[ProgramAccountSummary] = []
-            for it in res:
-                if isinstance(it, dict):
-                    out.append(tf.summarize_program_account(it))
-            return out
+            summarize = tf.summarize_program_account
+            return [summarize(it) for it in res if isinstance(it, dict)]
         return res
 
     def get_token_largest_accounts(
@@ -320,6 +475,15 @@ class HeliusService:
         mint: str,
         network: str = "mainnet",
         commitment: Optional[str] = None,
+    ) -> List[TokenLargestAccountItem]:
+        return self._largest_accounts_cache.get_or_load(
+            (mint, network, commitment),
+            lambda: self._load_token_largest_accounts(mint, network, commitment),
+            lambda value: isinstance(value, list),
+        )
+
+    def _load_token_largest_accounts(
+        self, mint: str, network: str, commitment: Optional[str]
     ) -> List[TokenLargestAccountItem]:
         params: List[Any] = [mint]
         if commitment:
@@ -343,8 +507,10 @@ class HeliusService:
         This method is designed for Jupiter API use cases where you need a "taker" 
         with guaranteed sufficient funds to simulate transactions.
         
-        First tries getTokenLargestAccounts, then falls back to DAS getTokenAccounts 
-        pagination for large tokens like USDC/SOL/USDT that have too many accounts.
+        For mints with a known whale list (USDC/SOL/USDT) that list is checked first with a
+        single batched SOL-balance lookup; if it yields max_results funded addresses, no
+        further requests are made. Otherwise tries getTokenLargestAccounts, then falls back
+        to DAS getTokenAccounts pagination for large tokens that have too many accounts.
         
         Args:
             mint: Token mint address
@@ -356,27 +522,35 @@ class HeliusService:
         Returns:
             List of addresses that meet the whale criteria
         """
-        # First try the standard RPC method
+        min_sol_lamports = int(min_sol_balance * LAMPORTS_PER_SOL)
+
+        # Known whales for the big mints: one getMultipleAccounts instead of a largest-accounts/DAS scan
+        known = self._get_known_whale_addresses(mint, network)
+        if len(known) >= max_results:
+            try:
+                funded = self._filter_by_sol_balance(known, network, min_sol_lamports)
+            except RuntimeError:
+                # RPC-level error (or malformed reply): try the scan below. HTTP errors such as a 429
+                # propagate, since the scan would only add load to a throttled provider.
+                funded = []
+            if len(funded) >= max_results:
+                return funded[:max_results]
+
+        # Then try the standard RPC method
         try:
             largest = self.get_token_largest_accounts(mint, network)
             if largest and len(largest) > 0:
-                # Extract addresses from successful response
-                whale_addresses = []
+                # Collect holders that pass the token filter, then check SOL for fees in one batch
+                candidates: List[str] = []
                 for account in largest:
-                    if account.address and account.ui_amount_string:
+                    if account.address and account.ui_amount_string and account.address not in candidates:
                         try:
-                            amount = float(account.ui_amount_string)
-                            if amount >= min_amount_ui:
-                                # Check SOL balance for fees
-                                sol_balance = self.get_balance(account.address, network)
-                                sol_amount = sol_balance / 1_000_000_000  # Convert lamports to SOL
-                                if sol_amount >= min_sol_balance:
-                                    whale_addresses.append(account.address)
-                                    if len(whale_addresses) >= max_results:
-                                        break
+                            if float(account.ui_amount_string) >= min_amount_ui:
+                                candidates.append(account.address)
                         except (ValueError, TypeError):
                             continue
-                
+
+                whale_addresses = self._filter_by_sol_balance(candidates, network, min_sol_lamports)[:max_results]
                 if whale_addresses:
                     return whale_addresses
                     
@@ -410,87 +584,79 @@ class HeliusService:
 
         # Default decimals for common fungible tokens; refined per-account when possible
         default_decimals = 6
+        # Loop invariants: the SOL threshold, 10**decimals per decimals value seen, and the bound calls
+        min_sol_lamports = int(min_sol_balance * LAMPORTS_PER_SOL)
+        pow10: Dict[int, int] = {default_decimals: 10 ** default_decimals}
+        rpc = self.client.rpc
+        # mint/limit never change between pages; only the cursor is updated in place
+        params: Dict[str, Any] = {"mint": mint, "limit": limit}
+
+        # Phase 1 collects holders passing the token filter across pages; phase 2 SOL-checks them in one batch
+        candidates: List[str] = []
+        # An owner can hold several token accounts for the mint: accept (and SOL-check) each owner once
+        seen_owners: Set[str] = set()
+
+        def consider(it: Any) -> None:
+            # Prefer balance.uiAmountString; else scale the raw amount by balance.decimals (or the default)
+            if not isinstance(it, dict):
+                return
+            owner = it.get("owner")
+            if not owner or owner in seen_owners:
+                return
+            bal = it.get("balance")
+            if not isinstance(bal, dict):
+                bal = {}
+            ui_amt_str = bal.get("uiAmountString")
+            dec = bal.get("decimals")
+            amount_raw = it.get("amount")
+            amount_ui: Optional[float] = None
+            if isinstance(ui_amt_str, str):
+                try:
+                    amount_ui = float(ui_amt_str)
+                except ValueError:
+                    amount_ui = None
+            if amount_ui is None and isinstance(amount_raw, int):
+                if not isinstance(dec, int):
+                    dec = default_decimals
+                scale = pow10.get(dec)
+                if scale is None:
+                    scale = pow10[dec] = 10 ** dec
+                amount_ui = amount_raw / scale
+            if amount_ui is not None and amount_ui >= min_amount_ui:
+                seen_owners.add(owner)
+                candidates.append(owner)
 
         while len(whale_addresses) < max_results and iterations < max_iterations:
             iterations += 1
             try:
-                params: Dict[str, Any] = {"mint": mint, "limit": limit}
                 if cursor:
                     params["cursor"] = cursor
 
-                das_result = self.client.rpc(network, "getTokenAccounts", params)
-                # Validate against DAS schema for consistency
-                try:
-                    raw = tf.RawDasTokenAccountsResult.model_validate(das_result)  # type: ignore[attr-defined]
-                except Exception:
-                    # Fallback to dict-parsing if validation fails
-                    raw = None
-
-                if raw is not None:
-                    items = raw.items or []
-                else:
-                    if not isinstance(das_result, dict):
-                        break
-                    items = das_result.get("items") or []
-                    if not isinstance(items, list) or not items:
-                        break
-
+                # Only owner/amount/balance/cursor are needed, so read them straight from the decoded
+                # JSON rather than validating every 1000-item page into models first
+                das_result = rpc(network, "getTokenAccounts", params)
+                items = das_result.get("items") if isinstance(das_result, dict) else None
+                if not isinstance(items, list):
+                    items = []
                 for it in items:
-                    if len(whale_addresses) >= max_results:
-                        break
-                    try:
-                        # Support both validated model and dict
-                        if hasattr(it, "owner"):
-                            owner = it.owner
-                            amount_raw = it.amount
-                            bal = getattr(it, "balance", None)
-                        else:
-                            owner = it.get("owner") if isinstance(it, dict) else None
-                            amount_raw = it.get("amount") if isinstance(it, dict) else None
-                            bal = it.get("balance") if isinstance(it, dict) else None
-
-                        if not owner:
-                            continue
-
-                        # Prefer balance.decimals/uiAmountString if present
-                        amount_ui: Optional[float] = None
-                        decimals_for_item: Optional[int] = None
-
-                        balance_obj = bal if isinstance(bal, (dict,)) or bal is not None else None
-                        if isinstance(balance_obj, dict) or hasattr(balance_obj, "uiAmountString"):
-                            ui_amt_str = balance_obj.get("uiAmountString") if isinstance(balance_obj, dict) else balance_obj.uiAmountString
-                            if isinstance(ui_amt_str, str):
-                                try:
-                                    amount_ui = float(ui_amt_str)
-                                except Exception:
-                                    amount_ui = None
-                            dec = balance_obj.get("decimals") if isinstance(balance_obj, dict) else balance_obj.decimals
-                            if isinstance(dec, int):
-                                decimals_for_item = dec
-
-                        if amount_ui is None and isinstance(amount_raw, int):
-                            dec = decimals_for_item if isinstance(decimals_for_item, int) else default_decimals
-                            amount_ui = float(amount_raw) / (10 ** dec)
-
-                        if amount_ui is None:
-                            continue
+                    consider(it)
 
-                        if amount_ui >= min_amount_ui:
-                            # Ensure owner has sufficient SOL for fees
-                            try:
-                                sol_lamports = self.get_balance(owner, network)
-                                if (sol_lamports or 0) >= int(min_sol_balance * 1_000_000_000):
-                                    whale_addresses.append(owner)
-                            except Exception:
-                                continue
-                    except Exception:
-                        continue
-
-                # Advance cursor; if no cursor returned, stop
-                cursor = (raw.cursor if raw is not None else das_result.get("cursor")) if isinstance(das_result, dict) or raw is not None else None
-                if not cursor:
-                    break
+                # Advance cursor; an empty/malformed page or no cursor ends paging
+                cursor = das_result.get("cursor") if items else None
             except Exception:
+                cursor = None
+
+            # Stop paging once there are twice as many candidates as still needed (some will lack SOL
+            # for fees) or paging is over, then check them all with one batched balance lookup
+            needed = max_results - len(whale_addresses)
+            if candidates and (len(candidates) >= 2 * needed or not cursor or iterations >= max_iterations):
+                try:
+                    funded = self._filter_by_sol_balance(candidates, network, min_sol_lamports)
+                except Exception:
+                    funded = []
+                whale_addresses.extend(funded[:needed])
+                candidates = []
+            if not cursor:
                 break
 
         if whale_addresses:
@@ -498,17 +664,62 @@ class HeliusService:
 
         # As a last resort, use known whales but enforce SOL balance and limit
         known_candidates = self._get_known_whale_addresses(mint, network)
-        filtered: List[str] = []
-        for addr in known_candidates:
-            if len(filtered) >= max_results:
-                break
-            try:
-                sol_lamports = self.get_balance(addr, network)
-                if (sol_lamports or 0) >= int(min_sol_balance * 1_000_000_000):
-                    filtered.append(addr)
-            except Exception:
-                continue
+        try:
+            filtered = self._filter_by_sol_balance(known_candidates, network, min_sol_lamports)[:max_results]
+        except Exception:
+            filtered = []
         return filtered or known_candidates[:max_results]
+
+    def _filter_by_sol_balance(self, addresses: List[str], network: str, min_lamports: int) -> List[str]:
+        """Keep (in order) the addresses holding at least ``min_lamports``."""
+        if not addresses:
+            return []
+        balances = self._get_balances_bulk(addresses, network)
+        return [addr for addr in addresses if balances.get(addr, 0) >= min_lamports]
+
+    def _get_balances_bulk(
+        self, pubkeys: List[str], network: str = "mainnet", commitment: str = "finalized"
+    ) -> Dict[str, int]:
+        """
+        Lamport balances for many pubkeys via getMultipleAccounts, 100 per call (batched when there are several).
+        A zero-length dataSlice means only account metadata (lamports) comes back. Missing accounts map to 0.
+        Shares the get_balance cache in both directions.
+        """
+        balances: Dict[str, int] = {}
+        missing: List[str] = []
+        for pubkey in dict.fromkeys(pubkeys):
+            cached = self._balance_cache.get((pubkey, network, commitment))
+            if cached is None:
+                missing.append(pubkey)
+            else:
+                balances[pubkey] = cached
+        cfg: Dict[str, Any] = {"encoding": "base64", "dataSlice": _METADATA_ONLY_SLICE, "commitment": commitment}
+        chunks = [missing[start:start + _MULTIPLE_ACCOUNTS_MAX] for start in range(0, len(missing), _MULTIPLE_ACCOUNTS_MAX)]
+        if len(chunks) > 1:
+            # Several chunks share one HTTP round trip as a JSON-RPC batch
+            try:
+                results = self.client.rpc_batch(network, [("getMultipleAccounts", [chunk, cfg]) for chunk in chunks])
+            except RpcBatchRejected:
+                # Provider refuses batching: overlap plain getBalance calls instead (get_balance fills the cache).
+                # Throttling, timeouts and 5xx propagate; fanning out then would only add load.
+                with ThreadPoolExecutor(max_workers=_BALANCE_FALLBACK_WORKERS) as pool:
+                    lamports_list = list(pool.map(lambda pubkey: self.get_balance(pubkey, network, commitment), missing))
+                balances.update(zip(missing, lamports_list))
+                return balances
+        else:
+            results = [self.client.rpc(network, "getMultipleAccounts", [chunk, cfg]) for chunk in chunks]
+        for chunk, res in zip(chunks, results):
+            values = res.get("value") if isinstance(res, dict) else None
+            if not isinstance(values, list):
+                raise RuntimeError(f"Unexpected getMultipleAccounts result: {res!r}")
+            if len(values) < len(chunk):
+                # A short reply is a provider fault, not empty accounts; don't cache zeros for it
+                raise RuntimeError(f"getMultipleAccounts returned no entry for: {', '.join(chunk[len(values):])}")
+            for pubkey, value in zip(chunk, values):
+                lamports = int(value.get("lamports") or 0) if isinstance(value, dict) else 0
+                balances[pubkey] = lamports
+                self._balance_cache.set((pubkey, network, commitment), lamports)
+        return balances
     
     def _get_known_whale_addresses(self, mint: str, network: str) -> List[str]:
         """
@@ -517,35 +728,6 @@ class HeliusService:
         """
         if network != "mainnet":
             return []
-        
-        # Known whale addresses for major tokens on mainnet
-        known_whales = {
-            # USDC whales (exchanges, market makers, etc)
-            "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v": [
-                "BQy5rNRxLfcaK6554PMzsg4VJsFXzwGnAnayb8TZKgZX",  # Circle
-                "CqCDNi1PSB7cP3rDxU12YKjVDqbJeZ9rGhxZxkkwi6mC",  # Major exchange
-                "9RfZwn2Prux6QesG1Noo4HzMEBkMvoYdkLRMKEZf86tT",  # Binance
-                "H8W3ctz92svYXCbxDdZGTCm66RBkXqudLV8Xjhj8HBJd",  # FTX
-                "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM",  # Alameda
-            ],
-            # SOL whales  
-            "So11111111111111111111111111111111111111112": [
-                "GjphYQcbP1m3FuDyCTUJf2mUMxKME2QyELubyyi8gH4E",  # Exchange
-                "J1S9H3QjnRtBbbuD4HjPV6RpRhwuk4zKbxsnCHuTgh9w",  # Validator
-                "Bd7VSwkqpwHjKPMRLQUPqTk5W7c1VRNDfSQ1YTVMQ52v",  # Foundation
-                "AhbYQB2Kw4tG3e8YmK8j5zJ4r3F8VXf6wUgkEoWsGkAJ",  # Market maker
-                "DfXygSm4jCyNCybVYYK6DwvWqjKee8pbDmJGcLWNDXjh",  # Large holder
-            ],
-            # USDT whales
-            "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB": [
-                "Q6LZqDG2J4E7KZAkfN5X9w3J8c7VGp9LhJy8aK5mYfDq",  # Exchange
-                "HAkqJgFCPRhtfvXBMVQ9BfrYPKQhcMp3FGVj9bwyNNMp",  # Tether treasury  
-                "J1S9H3QjnRtBbbuD4HjPV6RpRhwuk4zKbxsnCHuTgh9w",  # Market maker
-                "Bd7VSwkqpwHjKPMRLQUPqTk5W7c1VRNDfSQ1YTVMQ52v",  # Exchange 2
-                "AhbYQB2Kw4tG3e8YmK8j5zJ4r3F8VXf6wUgkEoWsGkAJ",  # Large holder
-            ]
-        }
-        
-        return known_whales.get(mint, [])
+        return list(_KNOWN_WHALES.get(mint, ()))
 
 
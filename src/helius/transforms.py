@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Tuple
 
+from pydantic import TypeAdapter
+
 from .schemas import (
     EnhancedTxSummary,
     NativeTransfer,
@@ -39,9 +41,24 @@ from .schemas import (
 )
 
 
+# Whole-list validators: one pydantic-core call per response instead of one per element
+_ENHANCED_TX_LIST = TypeAdapter(List[RawEnhancedTransaction])
+_SIGNATURE_ITEM_LIST = TypeAdapter(List[RawSignatureForAddressItem])
+
+
+# Per-item summaries below are built from fields of an already-validated Raw* model, so their
+# types are known to match; `model_construct` skips re-running validation for every list element.
+
+
 def summarize_enhanced_tx(tx: Dict[str, Any]) -> EnhancedTxSummary:
-    raw = RawEnhancedTransaction.model_validate(tx)
+    return _summarize_enhanced_raw(RawEnhancedTransaction.model_validate(tx))
 
+
+def summarize_enhanced_txs(txs: List[Dict[str, Any]]) -> List[EnhancedTxSummary]:
+    return [_summarize_enhanced_raw(raw) for raw in _ENHANCED_TX_LIST.validate_python(txs)]
+
+
+def _summarize_enhanced_raw(raw: RawEnhancedTransaction) -> EnhancedTxSummary:
     signature = raw.signature
     slot = raw.slot
     timestamp = raw.timestamp
@@ -59,49 +76,14 @@ def summarize_enhanced_tx(tx: Dict[str, Any]) -> EnhancedTxSummary:
             # Heuristics: consider InstructionError/err keys as failure
             succeeded = (status.get("InstructionError") is None) and (status.get("err") is None)
 
-    native_transfers: List[NativeTransfer] = []
-    for nt in raw.native_transfers or []:
-        try:
-            native_transfers.append(
-                NativeTransfer(
-                    from_addr=(nt.from_user_account or nt.from_ or ""),
-                    to_addr=(nt.to_user_account or nt.to_ or ""),
-                    amount_lamports=int(nt.amount or 0),
-                )
-            )
-        except Exception:
-            continue
-
-    token_transfers: List[TokenTransfer] = []
-    for tt in raw.token_transfers or []:
-        # amount might be string/int or object with amount field
-        amount_str: str = ""
-        if isinstance(tt.token_amount, dict):
-            val = tt.token_amount.get("amount")
-            amount_str = str(val) if val is not None else ""
-        elif isinstance(tt.token_amount, (int, str, float)):
-            amount_str = str(tt.token_amount)
-
-        decimals_val: Optional[int] = None
-        if isinstance(tt.decimals, int):
-            decimals_val = tt.decimals
-        elif isinstance(tt.token_amount, dict):
-            d2 = tt.token_amount.get("decimals")
-            try:
-                if d2 is not None:
-                    decimals_val = int(d2)
-            except Exception:
-                decimals_val = None
-
-        token_transfers.append(
-            TokenTransfer(
-                mint=tt.mint or "",
-                from_addr=(tt.from_user_account or tt.from_token_account or tt.from_ or ""),
-                to_addr=(tt.to_user_account or tt.to_token_account or tt.to_ or ""),
-                amount=amount_str,
-                decimals=decimals_val,
-            )
-        )
+    native_transfers: List[NativeTransfer] = [
+        NativeTransfer.model_construct(from_addr=f, to_addr=t, amount_lamports=a)
+        for f, t, a in (nt.as_summary_tuple() for nt in raw.native_transfers)
+    ]
+    token_transfers: List[TokenTransfer] = [
+        TokenTransfer.model_construct(mint=m, from_addr=f, to_addr=t, amount=a, decimals=d)
+        for m, f, t, a, d in (tt.as_summary_tuple() for tt in raw.token_transfers)
+    ]
 
     return EnhancedTxSummary(
         signature=signature,
@@ -118,8 +100,15 @@ def summarize_enhanced_tx(tx: Dict[str, Any]) -> EnhancedTxSummary:
 
 
 def summarize_signature_info(entry: Dict[str, Any]) -> SignatureInfo:
-    raw = RawSignatureForAddressItem.model_validate(entry)
-    return SignatureInfo(
+    return _summarize_signature_raw(RawSignatureForAddressItem.model_validate(entry))
+
+
+def summarize_signature_infos(entries: List[Dict[str, Any]]) -> List[SignatureInfo]:
+    return [_summarize_signature_raw(raw) for raw in _SIGNATURE_ITEM_LIST.validate_python(entries)]
+
+
+def _summarize_signature_raw(raw: RawSignatureForAddressItem) -> SignatureInfo:
+    return SignatureInfo.model_construct(
         signature=raw.signature,
         slot=raw.slot,
         block_time=raw.blockTime,
@@ -317,24 +306,11 @@ def summarize_assets_page(result: Dict[str, Any]) -> AssetsPageSummary:
     for it in parsed.items or []:
         # RawDasAsset -> dict for reuse of summarize_asset
         items.append(summarize_asset(it.model_dump(by_alias=True)))
-    native_balance = parsed.nativeBalance if parsed.nativeBalance is not None else parsed.native_balance
-    native_lamports: Optional[int] = None
-    if isinstance(native_balance, dict):
-        lamports = native_balance.get("lamports") or native_balance.get("amount")
-        try:
-            if lamports is not None:
-                native_lamports = int(lamports)
-        except Exception:
-            native_lamports = None
-    elif isinstance(native_balance, (int, str)):
-        try:
-            native_lamports = int(native_balance)
-        except Exception:
-            native_lamports = None
+    native_balance = parsed.nativeBalance or parsed.native_balance
     return AssetsPageSummary(
         total=parsed.total,
         items=items,
-        native_balance_lamports=native_lamports,
+        native_balance_lamports=native_balance.lamports if native_balance else None,
     )
 
 
@@ -355,7 +331,7 @@ def summarize_token_accounts(result: Dict[str, Any]) -> TokenAccountsResult:
         elif it.amount is not None:
             amount = str(it.amount)
         out_items.append(
-            TokenAccountSummary(
+            TokenAccountSummary.model_construct(
                 token_account=token_account,
                 owner=owner,
                 mint=mint,
@@ -430,7 +406,7 @@ def summarize_token_largest_accounts(result: Dict[str, Any]) -> List[TokenLarges
     items: List[TokenLargestAccountItem] = []
     for it in parsed.value or []:
         items.append(
-            TokenLargestAccountItem(
+            TokenLargestAccountItem.model_construct(
                 address=it.address,
                 amount=it.amount,
                 decimals=it.decimals,
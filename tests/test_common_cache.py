@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+import common.cache as cache_mod
+from common.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = {"t": 100.0}
+    monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now["t"])
+    cache = TTLCache(maxsize=8, ttl_seconds=5.0)
+    cache.set("k", 1)
+    assert cache.get("k") == 1
+    now["t"] += 5.0
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache(maxsize=2, ttl_seconds=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # touch "a" so "b" becomes the oldest
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    cache.invalidate("a")
+    assert cache.get("a", "missing") == "missing"
+
+
+def test_ttl_cache_get_or_load_coalesces_concurrent_misses() -> None:
+    import threading
+    import time
+
+    cache = TTLCache(maxsize=8, ttl_seconds=60.0)
+    calls = {"count": 0}
+    start = threading.Event()
+
+    def loader() -> str:
+        calls["count"] += 1
+        time.sleep(0.05)
+        return "v"
+
+    results = []
+
+    def worker() -> None:
+        start.wait()
+        results.append(cache.get_or_load("k", loader))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    start.set()
+    for t in threads:
+        t.join()
+    assert results == ["v"] * 8
+    assert calls["count"] == 1
+
+
+def test_ttl_cache_get_or_load_does_not_cache_errors() -> None:
+    cache = TTLCache()
+
+    def boom() -> None:
+        raise RuntimeError("x")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("k", boom)
+    assert cache.get_or_load("k", lambda: 1) == 1
+
+
+def test_ttl_cache_get_or_load_skips_rejected_values() -> None:
+    cache = TTLCache()
+    assert cache.get_or_load("k", lambda: None, lambda v: v is not None) is None
+    assert "k" not in cache._data
+    assert cache.get_or_load("k", lambda: 1, lambda v: v is not None) == 1
+    assert cache.get("k") == 1
+
+
+def test_ttl_cache_invalidate_where() -> None:
+    cache = TTLCache()
+    cache.set(("a", "mainnet"), 1)
+    cache.set(("a", "devnet"), 2)
+    cache.set(("b", "mainnet"), 3)
+    cache.invalidate_where(lambda key: key[0] == "a")
+    assert len(cache) == 1 and cache.get(("b", "mainnet")) == 3
+
+
+def test_ttl_cache_stats_count_hits_and_misses() -> None:
+    cache = TTLCache(maxsize=4)
+    cache.get_or_load("k", lambda: 1)
+    cache.get_or_load("k", lambda: 2)
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 4}
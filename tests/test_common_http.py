@@ -5,13 +5,16 @@ from typing import Any
 
 import pytest
 
+import common.http as http_mod
 from common.http import HttpClient
 
 
 class DummyResponse:
-    def __init__(self, status_code: int, payload: Any = None):
+    def __init__(self, status_code: int, payload: Any = None, headers: Any = None):
         self.status_code = status_code
+        self.headers = headers or {}
         self._payload = payload if payload is not None else {"ok": True}
+        self.content = json.dumps(self._payload).encode()
 
     def raise_for_status(self) -> None:
         if self.status_code >= 400:
@@ -48,9 +51,83 @@ def test_http_client_gives_up_after_max(monkeypatch: pytest.MonkeyPatch) -> None
         calls["count"] += 1
         return DummyResponse(500)
 
+    monkeypatch.setattr(http_mod.time, "sleep", lambda seconds: None)
     monkeypatch.setattr(client, "_session", type("S", (), {"request": staticmethod(fake_request)})())
     with pytest.raises(Exception):
         client.get_json("http://x")
-    assert calls["count"] >= 3
+    assert calls["count"] == http_mod.MAX_ATTEMPTS
 
 
+def test_http_client_post_json_decodes_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = HttpClient()
+    payload = {"jsonrpc": "2.0", "result": {"value": [1, 2, 3]}}
+
+    sent = {}
+
+    def fake_request(method: str, url: str, **kwargs: Any) -> DummyResponse:  # type: ignore[override]
+        sent.update(kwargs)
+        return DummyResponse(200, payload)
+
+    monkeypatch.setattr(client, "_session", type("S", (), {"request": staticmethod(fake_request)})())
+    assert client.post_json("http://x", {"a": 1, 2: [2 ** 64 - 1]}) == payload
+    assert json.loads(sent["data"]) == {"a": 1, "2": [2 ** 64 - 1]}
+
+
+def test_http_client_honours_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = HttpClient()
+    sleeps = []
+    responses = [DummyResponse(429, headers={"Retry-After": "3"}), DummyResponse(200)]
+
+    def fake_request(method: str, url: str, **kwargs: Any) -> DummyResponse:  # type: ignore[override]
+        return responses.pop(0)
+
+    monkeypatch.setattr(http_mod.time, "sleep", sleeps.append)
+    monkeypatch.setattr(client, "_session", type("S", (), {"request": staticmethod(fake_request)})())
+    resp = client.request_with_retry("get", "http://x")
+    assert resp.status_code == 200
+    assert len(sleeps) == 1 and 3.0 <= sleeps[0] <= 3.0 + http_mod.BACKOFF_BASE_SECONDS
+
+
+def test_http_client_gives_up_on_long_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = HttpClient()
+    sleeps = []
+    calls = {"count": 0}
+
+    def fake_request(method: str, url: str, **kwargs: Any) -> DummyResponse:  # type: ignore[override]
+        calls["count"] += 1
+        return DummyResponse(429, headers={"Retry-After": "120"})
+
+    monkeypatch.setattr(http_mod.time, "sleep", sleeps.append)
+    monkeypatch.setattr(client, "_session", type("S", (), {"request": staticmethod(fake_request)})())
+    with pytest.raises(Exception):
+        client.get_json("http://x")
+    assert calls["count"] == 1 and sleeps == []
+
+
+def test_http_client_429_attempts_limited_separately(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = HttpClient()
+    calls = {"count": 0}
+
+    def fake_request(method: str, url: str, **kwargs: Any) -> DummyResponse:  # type: ignore[override]
+        calls["count"] += 1
+        return DummyResponse(429)
+
+    monkeypatch.setattr(http_mod.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(client, "_session", type("S", (), {"request": staticmethod(fake_request)})())
+    with pytest.raises(Exception):
+        client.get_json("http://x")
+    assert calls["count"] == http_mod.MAX_429_ATTEMPTS
+
+
+def test_http_client_does_not_retry_client_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = HttpClient()
+    calls = {"count": 0}
+
+    def fake_request(method: str, url: str, **kwargs: Any) -> DummyResponse:  # type: ignore[override]
+        calls["count"] += 1
+        return DummyResponse(404)
+
+    monkeypatch.setattr(client, "_session", type("S", (), {"request": staticmethod(fake_request)})())
+    resp = client.request_with_retry("get", "http://x")
+    assert resp.status_code == 404
+    assert calls["count"] == 1
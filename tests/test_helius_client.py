@@ -3,8 +3,9 @@ from __future__ import annotations
 from typing import Any, Dict
 
 import pytest
+import requests
 
-from helius.client import HeliusClient, _validate_network
+from helius.client import HeliusClient, RpcBatchRejected, _validate_network
 
 
 def test_validate_network() -> None:
@@ -52,3 +53,72 @@ def test_enhanced_and_rpc_urls() -> None:
     assert "api-key=" in url2 and "devnet" in url2
 
 
+def test_rotated_api_key_reaches_urls(monkeypatch: pytest.MonkeyPatch) -> None:
+    import helius.client as client_mod
+
+    c = HeliusClient(http=FakeHttp({}))  # type: ignore[arg-type]
+    monkeypatch.setattr(client_mod, "settings", None)
+    monkeypatch.setenv("HELIUS_API_KEY", "OLD")
+    client_mod._require_api_key.cache_clear()
+    assert c._rpc_url("mainnet").endswith("api-key=OLD")
+    monkeypatch.setenv("HELIUS_API_KEY", "NEW")
+    client_mod._require_api_key.cache_clear()
+    assert c._rpc_url("mainnet").endswith("api-key=NEW")
+    assert c._enhanced_url("/v0/transactions", "mainnet").endswith("api-key=NEW")
+    client_mod._require_api_key.cache_clear()
+
+
+def test_rpc_batch_orders_by_id_and_splits() -> None:
+    class BatchHttp(FakeHttp):
+        def post_json(self, url: str, json_body: Any) -> Any:
+            self.calls.append((url, json_body))
+            return [{"jsonrpc": "2.0", "id": c["id"], "result": c["params"][0]} for c in reversed(json_body)]
+
+    http = BatchHttp({})
+    c = HeliusClient(http=http)  # type: ignore[arg-type]
+    out = c.rpc_batch("mainnet", [("getBalance", [f"a{i}"]) for i in range(30)])
+    assert out == [f"a{i}" for i in range(30)]
+    assert [len(body) for _, body in http.calls] == [25, 5]
+
+
+def test_rpc_batch_item_error_raises() -> None:
+    http = FakeHttp({})
+    http.post_json = lambda url, json_body: [{"id": 0, "error": {"code": -32602, "message": "bad"}}]  # type: ignore[assignment]
+    c = HeliusClient(http=http)  # type: ignore[arg-type]
+    with pytest.raises(RuntimeError):
+        c.rpc_batch("mainnet", [("getBalance", ["a"])])
+
+
+def test_rpc_batch_errors_as_none() -> None:
+    http = FakeHttp({})
+    http.post_json = lambda url, json_body: [  # type: ignore[assignment]
+        {"id": 1, "result": "ok"},
+        {"id": 0, "error": {"code": -32602, "message": "bad"}},
+    ]
+    c = HeliusClient(http=http)  # type: ignore[arg-type]
+    out = c.rpc_batch("mainnet", [("getTransaction", ["x"]), ("getTransaction", ["y"])], errors_as_none=True)
+    assert out == [None, "ok"]
+
+
+@pytest.mark.parametrize(
+    "status, expected", [(400, RpcBatchRejected), (429, requests.HTTPError), (503, requests.HTTPError)]
+)
+def test_rpc_batch_http_errors(status: int, expected: type) -> None:
+    resp = requests.Response()
+    resp.status_code = status
+
+    def reject(url: str, json_body: Any) -> Any:
+        raise requests.HTTPError(f"HTTP {status}", response=resp)
+
+    http = FakeHttp({})
+    http.post_json = reject  # type: ignore[assignment]
+    c = HeliusClient(http=http)  # type: ignore[arg-type]
+    with pytest.raises(expected) as info:
+        c.rpc_batch("mainnet", [("getBalance", ["a"])])
+    assert (info.type is RpcBatchRejected) == (status == 400)
+
+
+def test_rpc_batch_non_list_response_is_rejection() -> None:
+    c = HeliusClient(http=FakeHttp({"jsonrpc": "2.0"}))  # type: ignore[arg-type]
+    with pytest.raises(RpcBatchRejected):
+        c.rpc_batch("mainnet", [("getBalance", ["a"])])
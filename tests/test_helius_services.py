@@ -3,7 +3,9 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 import pytest
+import requests
 
+from helius.client import RpcBatchRejected
 from helius.services import HeliusService
 
 
@@ -48,6 +50,11 @@ def test_service_get_balance_numeric_result() -> None:
     assert out == 12345
 
 
+def test_service_get_balance_bare_and_string_results() -> None:
+    assert HeliusService(client=FakeClient(42)).get_balance("addr") == 42
+    assert HeliusService(client=FakeClient({"value": "777"})).get_balance("addr") == 777
+
+
 def test_service_priority_fee_int_result() -> None:
     svc = HeliusService(client=FakeClient(17))
     out = svc.get_priority_fee_estimate()
@@ -96,3 +103,289 @@ def test_summarize_account_info_uses_raw_model() -> None:
     assert info.space == 42
 
 
+def test_service_get_asset_is_cached() -> None:
+    client = FakeClient({"id": "asset1", "interface": "V1_NFT"})
+    svc = HeliusService(client=client)
+    first = svc.get_asset("asset1")
+    second = svc.get_asset("asset1")
+    assert first.id == "asset1" and second is first
+    assert len(client.calls) == 1
+
+
+def test_service_raw_fallbacks_are_not_cached() -> None:
+    client = FakeClient(None)
+    svc = HeliusService(client=client)
+    assert svc.get_asset("x") is None and svc.get_asset("x") is None
+    assert svc.get_token_largest_accounts("m") is None and svc.get_token_largest_accounts("m") is None
+    assert len(client.calls) == 4
+
+
+class RoutingClient(FakeClient):
+    def __init__(self, payloads: Dict[str, Any]):
+        super().__init__(None)
+        self.payloads = payloads
+
+    def rpc(self, network: str, method: str, params: Any) -> Any:
+        self.calls.append({"network": network, "method": method, "params": params})
+        payload = self.payloads[method]
+        return payload(params) if callable(payload) else payload
+
+    def rpc_batch(self, network: str, calls: List[Any], errors_as_none: bool = False) -> List[Any]:
+        self.calls.append({"network": network, "batch": len(calls)})
+        return [self.rpc(network, method, params) for method, params in calls]
+
+
+def _lamports_for(balances: Dict[str, int]) -> Any:
+    def respond(params: Any) -> Dict[str, Any]:
+        return {"value": [{"lamports": balances[k]} if k in balances else None for k in params[0]]}
+    return respond
+
+
+def test_token_whales_check_sol_in_one_batch() -> None:
+    largest = {
+        "value": [
+            {"address": "W1", "amount": "1", "decimals": 0, "uiAmountString": "5000"},
+            {"address": "W2", "amount": "1", "decimals": 0, "uiAmountString": "5000"},
+            {"address": "W3", "amount": "1", "decimals": 0, "uiAmountString": "5000"},
+            {"address": "SMALL", "amount": "1", "decimals": 0, "uiAmountString": "1"},
+        ]
+    }
+    client = RoutingClient({
+        "getTokenLargestAccounts": largest,
+        "getMultipleAccounts": _lamports_for({"W1": 10**9, "W2": 1, "SMALL": 10**9}),
+    })
+    svc = HeliusService(client=client)
+    assert svc.get_token_whale_addresses("MINT", min_sol_balance=0.1) == ["W1"]
+    batch = [c for c in client.calls if c["method"] == "getMultipleAccounts"]
+    assert len(batch) == 1 and batch[0]["params"][0] == ["W1", "W2", "W3"]
+    assert batch[0]["params"][1]["dataSlice"] == {"offset": 0, "length": 0}
+
+
+def test_get_balances_bulk_chunks_at_100() -> None:
+    keys = [f"K{i}" for i in range(250)]
+    client = RoutingClient({"getMultipleAccounts": _lamports_for({k: i for i, k in enumerate(keys)})})
+    out = HeliusService(client=client)._get_balances_bulk(keys + ["K0"])
+    assert out["K249"] == 249 and len(out) == 250
+    assert client.calls[0] == {"network": "mainnet", "batch": 3}
+    assert [len(c["params"][0]) for c in client.calls[1:]] == [100, 100, 50]
+
+
+def test_get_balance_cached_until_invalidated() -> None:
+    client = FakeClient({"value": 5})
+    svc = HeliusService(client=client)
+    assert svc.get_balance("addr") == 5 and svc.get_balance("addr") == 5
+    assert len(client.calls) == 1
+    svc.invalidate("addr")
+    svc.get_balance("addr")
+    assert len(client.calls) == 2
+    # Bulk lookups reuse finalized balances already fetched
+    assert svc._get_balances_bulk(["addr"]) == {"addr": 5}
+    assert len(client.calls) == 2
+
+
+def test_token_whales_das_fallback_scales_raw_amounts() -> None:
+    def too_many(params: Any) -> Any:
+        raise RuntimeError("RPC error: Too many accounts requested")
+
+    page = {
+        "items": [
+            {"owner": "O1", "amount": 5_000_000_000},  # default 6 decimals -> 5000 UI
+            {"owner": "O2", "amount": 5_000, "balance": {"decimals": 0}},
+            {"owner": "O3", "amount": 1_000},  # 0.001 UI, filtered out
+        ]
+    }
+    client = RoutingClient({
+        "getTokenLargestAccounts": too_many,
+        "getTokenAccounts": page,
+        "getMultipleAccounts": _lamports_for({"O1": 10**9, "O2": 10**9, "O3": 10**9}),
+    })
+    out = HeliusService(client=client).get_token_whale_addresses("MINT", min_amount_ui=1000.0)
+    assert out == ["O1", "O2"]
+
+
+def test_token_whales_known_mint_short_circuits() -> None:
+    usdc = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+    client = RoutingClient({"getMultipleAccounts": lambda params: {"value": [{"lamports": 10**9}] * len(params[0])}})
+    svc = HeliusService(client=client)
+    out = svc.get_token_whale_addresses(usdc, max_results=3)
+    assert out == svc._get_known_whale_addresses(usdc, "mainnet")[:3]
+    assert [c["method"] for c in client.calls] == ["getMultipleAccounts"]
+
+
+def test_token_whales_known_mint_http_error_propagates() -> None:
+    def throttled(params: Any) -> Any:
+        resp = requests.Response()
+        resp.status_code = 429
+        raise requests.HTTPError("429 Too Many Requests", response=resp)
+
+    usdc = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+    client = RoutingClient({"getMultipleAccounts": throttled, "getTokenLargestAccounts": {"value": []}})
+    with pytest.raises(requests.HTTPError):
+        HeliusService(client=client).get_token_whale_addresses(usdc, max_results=3)
+    assert [c["method"] for c in client.calls] == ["getMultipleAccounts"]
+
+
+def test_token_whales_das_stops_paging_with_enough_candidates() -> None:
+    def too_many(params: Any) -> Any:
+        raise RuntimeError("RPC error: Too many accounts requested")
+
+    page = {"cursor": "next", "items": [{"owner": f"O{i}", "amount": 10**12} for i in range(4)]}
+    client = RoutingClient({
+        "getTokenLargestAccounts": too_many,
+        "getTokenAccounts": page,
+        "getMultipleAccounts": lambda params: {"value": [{"lamports": 10**9}] * len(params[0])},
+    })
+    out = HeliusService(client=client).get_token_whale_addresses("MINT", max_results=2)
+    assert out == ["O0", "O1"]
+    assert [c["method"] for c in client.calls].count("getTokenAccounts") == 1
+
+
+def test_token_whales_das_checks_pending_candidates_on_last_page() -> None:
+    def too_many(params: Any) -> Any:
+        raise RuntimeError("RPC error: Too many accounts requested")
+
+    pages = iter([
+        {"cursor": "c1", "items": [{"owner": "O1", "amount": 10**12}]},
+        {"cursor": None, "items": []},
+    ])
+    client = RoutingClient({
+        "getTokenLargestAccounts": too_many,
+        "getTokenAccounts": lambda params: next(pages),
+        "getMultipleAccounts": lambda params: {"value": [{"lamports": 10**9}] * len(params[0])},
+    })
+    assert HeliusService(client=client).get_token_whale_addresses("MINT", max_results=5) == ["O1"]
+
+
+def test_token_whales_das_dedupes_owners() -> None:
+    def too_many(params: Any) -> Any:
+        raise RuntimeError("RPC error: Too many accounts requested")
+
+    page = {"items": [
+        {"owner": "O1", "amount": 1},  # small account, does not count against O1
+        {"owner": "O1", "amount": 10**12},
+        {"owner": "O1", "amount": 10**12},
+        {"owner": "O2", "amount": 10**12},
+    ]}
+    client = RoutingClient({
+        "getTokenLargestAccounts": too_many,
+        "getTokenAccounts": page,
+        "getMultipleAccounts": lambda params: {"value": [{"lamports": 10**9}] * len(params[0])},
+    })
+    out = HeliusService(client=client).get_token_whale_addresses("MINT", max_results=5)
+    assert out == ["O1", "O2"]
+    batch = [c for c in client.calls if c.get("method") == "getMultipleAccounts"]
+    assert batch[0]["params"][0] == ["O1", "O2"]
+
+
+def test_get_multiple_accounts_metadata_only_slices_data() -> None:
+    client = FakeClient({"value": [{"lamports": 1, "owner": "O", "data": ["", "base64"]}]})
+    out = HeliusService(client=client).get_multiple_accounts(
+        ["k"], data_slice={"offset": 0, "length": 64}, metadata_only=True
+    )
+    assert out[0] is not None and out[0].lamports == 1
+    cfg = client.calls[0]["params"][1]
+    assert cfg["encoding"] == "base64" and cfg["dataSlice"] == {"offset": 0, "length": 0}
+
+
+def test_get_balances_bulk_falls_back_when_batch_rejected() -> None:
+    class NoBatchClient(RoutingClient):
+        def rpc_batch(self, network: str, calls: List[Any], errors_as_none: bool = False) -> List[Any]:
+            raise RpcBatchRejected("batch requests are not supported")
+
+    keys = [f"K{i}" for i in range(150)]
+    client = NoBatchClient({"getBalance": lambda params: {"value": int(params[0][1:])}})
+    out = HeliusService(client=client)._get_balances_bulk(keys)
+    assert out == {k: i for i, k in enumerate(keys)}
+    assert len(client.calls) == 150
+
+
+def test_get_balances_bulk_does_not_fan_out_when_throttled() -> None:
+    class ThrottledClient(RoutingClient):
+        def rpc_batch(self, network: str, calls: List[Any], errors_as_none: bool = False) -> List[Any]:
+            resp = requests.Response()
+            resp.status_code = 429
+            raise requests.HTTPError("429 Too Many Requests", response=resp)
+
+    client = ThrottledClient({"getBalance": {"value": 1}})
+    with pytest.raises(requests.HTTPError):
+        HeliusService(client=client)._get_balances_bulk([f"K{i}" for i in range(150)])
+    assert client.calls == []
+
+
+def test_get_balances_batch_uses_cache_and_keeps_order() -> None:
+    client = RoutingClient({
+        "getBalance": lambda params: {"value": int(params[0][1:])},
+        "getMultipleAccounts": _lamports_for({"K1": 1, "K2": 2}),
+    })
+    svc = HeliusService(client=client)
+    assert svc.get_balance("K7") == 7
+    out = svc.get_balances_batch(["K1", "K7", "K2", "K1"])
+    assert out == [1, 7, 2, 1]
+    bulk = [c for c in client.calls if c.get("method") == "getMultipleAccounts"]
+    assert len(bulk) == 1 and bulk[0]["params"][0] == ["K1", "K2"]
+
+
+def test_get_balances_batch_short_response_names_missing_keys() -> None:
+    client = RoutingClient({"getMultipleAccounts": {"value": [{"lamports": 1}]}})
+    svc = HeliusService(client=client)
+    with pytest.raises(RuntimeError, match="K2, K3"):
+        svc.get_balances_batch(["K1", "K2", "K3"])
+    assert len(svc._balance_cache) == 0
+
+
+def test_get_transactions_raw_batch_summarizes_each() -> None:
+    def tx(params: Any) -> Any:
+        sig = params[0]
+        return {"meta": {"logMessages": [sig]}, "transaction": {"signatures": [sig]}} if sig != "gone" else None
+
+    class ErrorsClient(RoutingClient):
+        def rpc_batch(self, network: str, calls: List[Any], errors_as_none: bool = False) -> List[Any]:
+            self.calls.append({"batch": len(calls), "errors_as_none": errors_as_none})
+            return super().rpc_batch(network, calls, errors_as_none)
+
+    client = ErrorsClient({"getTransaction": tx})
+    out = HeliusService(client=client).get_transactions_raw_batch(["a", "gone", "b"])
+    assert out[0].signature == "a" and out[1] is None and out[2].signature == "b"
+    assert client.calls[0] == {"batch": 3, "errors_as_none": True}
+
+
+def test_get_account_infos_batch_chunks_and_keeps_order() -> None:
+    keys = [f"K{i}" for i in range(120)]
+    client = RoutingClient({"getMultipleAccounts": lambda params: {
+        "value": [{"lamports": int(k[1:]), "owner": "O"} if k != "K5" else None for k in params[0]]
+    }})
+    out = HeliusService(client=client).get_account_infos_batch(keys)
+    assert len(out) == 120 and out[5] is None and out[119] is not None and out[119].lamports == 119
+
+
+def test_get_transactions_requests_only_uncached_signatures() -> None:
+    class TxClient(FakeClient):
+        def rest_post(self, url: str, body: Dict[str, Any]) -> Any:
+            self.calls.append({"url": url, "body": body})
+            return [{"signature": sig, "status": "success"} for sig in body["transactions"]]
+
+    client = TxClient(None)
+    svc = HeliusService(client=client)
+    svc.get_transactions(["a", "b"])
+    out = svc.get_transactions(["b", "c", "a"])
+    assert [t.signature for t in out] == ["b", "c", "a"]
+    assert client.calls[-1]["body"] == {"transactions": ["c"]}
+    assert svc.cache_stats()["transactions"]["hits"] == 2
+
+
+def test_get_transaction_raw_caches_finalized_only() -> None:
+    client = FakeClient({"meta": {"logMessages": []}, "transaction": {"signatures": ["s"]}})
+    svc = HeliusService(client=client)
+    svc.get_transaction_raw("s")
+    svc.get_transaction_raw("s")
+    svc.get_transaction_raw("s", commitment="confirmed")
+    assert len(client.calls) == 2
+
+
+def test_search_assets_builds_traits() -> None:
+    client = FakeClient({"items": []})
+    HeliusService(client=client).search_assets(attributes={"Hat": "Red", "Eyes": ["Blue", "Green"]})  # type: ignore[dict-item]
+    assert client.calls[0]["params"]["traits"] == [
+        {"trait_type": "Hat", "values": ["Red"]},
+        {"trait_type": "Eyes", "values": ["Blue", "Green"]},
+    ]
@@ -37,3 +37,50 @@ def test_summarize_raw_transaction_truncates_logs() -> None:
     assert len(out.log_messages) == 30
 
 
+def test_summarize_enhanced_txs_matches_single() -> None:
+    txs = [
+        {"signature": "a", "status": "success", "nativeTransfers": [{"from": "A", "to": "B", "amount": 1}]},
+        {"signature": "b", "transactionError": {"InstructionError": [0, "x"]}},
+    ]
+    batch = tf.summarize_enhanced_txs(txs)
+    assert [s.model_dump() for s in batch] == [tf.summarize_enhanced_tx(t).model_dump() for t in txs]
+    assert batch[0].succeeded is True and batch[1].succeeded is False
+
+
+def test_token_amount_variants_normalised() -> None:
+    tx = {
+        "tokenTransfers": [
+            {"mint": "M", "tokenAmount": 0.5, "decimals": 9},
+            {"mint": "M", "tokenAmount": 7},
+            {"mint": "M", "tokenAmount": {"amount": "10", "decimals": "3"}},
+            {"mint": "M"},
+        ]
+    }
+    out = tf.summarize_enhanced_tx(tx).token_transfers
+    assert [(t.amount, t.decimals) for t in out] == [("0.5", 9), ("7", None), ("10", 3), ("", None)]
+
+
+def test_summarize_multiple_accounts_skips_unchanged() -> None:
+    result = {"value": [{"lamports": 5, "owner": "O", "data": ["", "base64"]}, {"status": "unchanged"}, None]}
+    out = tf.summarize_multiple_accounts(result)
+    assert out[0] is not None and out[0].lamports == 5
+    assert out[1] is None and out[2] is None
+
+
+def test_summarize_assets_page_native_balance_shapes() -> None:
+    assert tf.summarize_assets_page({"nativeBalance": 42}).native_balance_lamports == 42
+    assert tf.summarize_assets_page({"nativeBalance": {"lamports": 7, "price_per_sol": 1.5}}).native_balance_lamports == 7
+    assert tf.summarize_assets_page({"nativeBalance": {"lamports": 5, "price_per_sol": "n/a"}}).native_balance_lamports == 5
+    assert tf.summarize_assets_page({"native_balance": {"amount": "9"}}).native_balance_lamports == 9
+    assert tf.summarize_assets_page({"nativeBalance": "bad"}).native_balance_lamports is None
+    assert tf.summarize_assets_page({}).native_balance_lamports is None
+
+
+def test_schemas_fully_built_at_import() -> None:
+    from helius import schemas
+
+    pending = [schemas._BaseModel]
+    while pending:
+        cls = pending.pop()
+        assert cls.__pydantic_complete__, cls.__name__
+        pending.extend(cls.__subclasses__())
@@ -36,3 +36,83 @@ def test_mcp_tools_call_service(monkeypatch: pytest.MonkeyPatch) -> None:
     assert bal == 42
 
 
+def test_register_mcp_tools_is_idempotent(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[str] = []
+
+    class FakeMcp:
+        def tool(self):  # type: ignore[no-untyped-def]
+            def deco(fn):  # type: ignore[no-untyped-def]
+                calls.append(fn.__name__)
+                return fn
+            return deco
+
+    monkeypatch.setattr(helius_mcp, "mcp", FakeMcp())
+    monkeypatch.setattr(helius_mcp, "_TOOLS_REGISTERED", False)
+    helius_mcp.register_mcp_tools()
+    first = len(calls)
+    helius_mcp.register_mcp_tools()
+    assert first == len(helius_mcp._TOOLS)
+    assert len(calls) == first
+
+
+def test_list_tools_dump_models_in_bulk(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.helius.schemas import SignatureStatus
+
+    class StatusService:
+        def get_signature_statuses(self, signatures, network, search_transaction_history, commitment):  # type: ignore[no-untyped-def]
+            return [SignatureStatus(slot=1, confirmation_status="finalized"), None]
+
+    monkeypatch.setattr(helius_mcp, "_service", StatusService())
+    out = helius_mcp.get_signature_statuses(["a", "b"])
+    assert out[0]["slot"] == 1 and out[0]["confirmation_status"] == "finalized"
+    assert out[1] is None
+
+
+def test_signatures_limit_bounded_by_tool_schema() -> None:
+    from pydantic import ValidationError, validate_call
+
+    tool = validate_call(helius_mcp.get_signatures_for_address)
+    with pytest.raises(ValidationError):
+        tool("addr", limit=5000)
+    with pytest.raises(ValidationError):
+        tool("addr", limit=0)
+
+
+def test_batch_tools_are_registered_and_dump(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.helius.schemas import TxRawSummary
+
+    class BatchService:
+        def get_transactions_raw_batch(self, signatures, network, encoding, commitment):  # type: ignore[no-untyped-def]
+            return [TxRawSummary(signature=signatures[0], slot=3), None]
+
+        def get_balances_batch(self, public_keys, network, commitment):  # type: ignore[no-untyped-def]
+            return [1 for _ in public_keys]
+
+    monkeypatch.setattr(helius_mcp, "_service", BatchService())
+    out = helius_mcp.get_transactions_raw_batch(["s", "gone"])
+    assert out[0]["signature"] == "s" and out[0]["slot"] == 3 and out[1] is None
+    assert helius_mcp.get_balances_batch(["a", "b"]) == [1, 1]
+    assert helius_mcp.get_account_infos_batch in helius_mcp._TOOLS
+
+
+def test_get_service_builds_one_instance_under_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+    import time
+
+    built = []
+
+    class SlowService:
+        def __init__(self) -> None:
+            time.sleep(0.01)
+            built.append(self)
+            self.client = type("C", (), {"http": type("H", (), {"close": lambda self: None})()})()
+
+    monkeypatch.setattr(helius_mcp, "_service", None)
+    monkeypatch.setattr(helius_mcp, "HeliusService", SlowService)
+    monkeypatch.setattr(helius_mcp.atexit, "register", lambda fn: fn)
+    threads = [threading.Thread(target=helius_mcp._get_service) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(built) == 1 and helius_mcp._service is built[0]